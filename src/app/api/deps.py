@@ -9,6 +9,7 @@ from ..domain.domain_type import AIModelVendor
 from ..domain.model_catalog import ModelCatalog, ModelRegistry, ModelSpec
 from ..service import ConversationService, create_conversation_service
 from ..service.storage import (
+    EmbeddingConfig,
     MemoryStoreConfig,
     ObjectStoreConfig,
     StorageService,
@@ -144,4 +145,8 @@ def get_storage_service() -> StorageService:
             url=settings.qdrant_url,
             collection=settings.qdrant_collection,
         ),
+        embedding_config=EmbeddingConfig(
+            ollama_url=settings.ollama_base_url,
+            ollama_timeout=settings.ollama_timeout,
+        ),
     )
@@ -100,6 +100,9 @@ class Settings(BaseSettings):
     together_api_key: str | None = Field(default=None, alias="TOGETHER_API_KEY")
     tavily_api_key: str = Field(..., alias="TAVILY_API_KEY")
 
+    # Agent tools
+    calculator_timeout_s: float = Field(default=1.0, gt=0, alias="CALCULATOR_TIMEOUT_S")
+
     # =============================================================================
     # PERFORMANCE
     # =============================================================================
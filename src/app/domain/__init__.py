@@ -36,10 +36,11 @@ from .model_catalog import (
     VendorCatalog,
 )
 from .model_pool import ModelPool
-from .tools import ALL_TOOLS, calculator, tavily_search
+from .tools import ALL_TOOL_NAMES, ALL_TOOLS, calculator, tavily_search
 
 __all__ = [
     "ALL_TOOLS",
+    "ALL_TOOL_NAMES",
     "AIModelVendor",
     "Conversation",
     "ConversationHistory",
@@ -209,9 +209,9 @@ class ToolClassifier(BaseModel):
         decision: ToolDecision = result.output
 
         # Validate tools exist
-        from .tools import ALL_TOOLS
+        from .tools import ALL_TOOL_NAMES
 
-        valid_tools = [tool for tool in decision.tools if tool in ALL_TOOLS]
+        valid_tools = [tool for tool in decision.tools if tool in ALL_TOOL_NAMES]
 
         return valid_tools
 
@@ -425,10 +425,8 @@ class Conversation(BaseModel):
         #   3. ModelResponse with final text answer
         response_messages = [StoredMessage(id=MessageId(), content=msg) for msg in result.new_messages()]
 
-        # Immutably append all response messages to history
-        final_history = updated_history
-        for response_msg in response_messages:
-            final_history = final_history.append_message(response_msg)
+        # Immutably append all response messages to history in one copy
+        final_history = updated_history.extend_messages(response_messages)
 
         # === Step 4: Return New Conversation ===
         # Algebraic update: return new instance with updated history
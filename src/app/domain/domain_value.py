@@ -16,6 +16,7 @@ This separation allows us to:
 
 from __future__ import annotations
 
+from collections.abc import Iterable
 from uuid import UUID, uuid4
 
 from pydantic import BaseModel, ConfigDict, Field, RootModel
@@ -164,5 +165,23 @@ class ConversationHistory(BaseModel):
         """
         return self.model_copy(update={"messages": (*self.messages, msg)})
 
+    def extend_messages(self, msgs: Iterable[StoredMessage]) -> ConversationHistory:
+        """Append Many Messages Immutably in One Copy.
+
+        Equivalent to chaining append_message over msgs, but builds the new
+        tuple once. Chained appends copy the growing tuple per message -
+        O(N²) element copies for N messages versus O(N) here.
+
+        Args:
+            msgs: StoredMessages to append, in order
+
+        Returns:
+            New ConversationHistory instance with all messages added
+
+        Example:
+            >>> history = history.extend_messages(response_messages)
+        """
+        return self.model_copy(update={"messages": (*self.messages, *msgs)})
+
 
 __all__ = ["ConversationHistory", "ConversationId", "MessageId", "StoredMessage"]
@@ -85,16 +85,16 @@ class ModelPool(BaseModel):
         """
         from pydantic_ai import Agent
 
-        from .tools import ALL_TOOLS
+        from .tools import ALL_TOOL_NAMES, ALL_TOOLS
 
         # Build cache key and resolve tool functions
         if tool_names is None:
             # No filtering - use all available tools
             tool_funcs = list(ALL_TOOLS.values())
-            cache_key = (spec, frozenset(ALL_TOOLS.keys()))
+            cache_key = (spec, ALL_TOOL_NAMES)
         else:
             # Filter to requested tools only (invalid names silently ignored)
-            tool_funcs = [ALL_TOOLS[name] for name in tool_names if name in ALL_TOOLS]
+            tool_funcs = [ALL_TOOLS[name] for name in tool_names if name in ALL_TOOL_NAMES]
             cache_key = (spec, frozenset(tool_names))
 
         # Lazy initialization on cache miss
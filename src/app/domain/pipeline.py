@@ -37,10 +37,13 @@ Example Usage:
 from __future__ import annotations
 
 from collections import Counter
+from collections.abc import Iterable
+from dataclasses import dataclass
 from datetime import UTC, datetime
-from typing import Any, Literal
+from operator import attrgetter
+from typing import Any, ClassVar, Literal, Self
 
-from pydantic import BaseModel, ConfigDict, Field, RootModel, computed_field, model_validator
+from pydantic import BaseModel, ConfigDict, Field, PrivateAttr, RootModel, computed_field, model_validator
 
 from .domain_type import ErrorCategory, SkipReason, StageCategory, StageStatus
 
@@ -172,7 +175,9 @@ class ErrorSummary(RootModel[dict[ErrorCategory, int]]):
         """
         if not self.root:
             return None
-        return max(self.root.items(), key=lambda x: x[1])[0]
+        # Same first-wins tie-breaking as Counter.most_common(1), without
+        # copying root into a Counter; the bound __getitem__ key runs in C
+        return max(self.root, key=self.root.__getitem__)
 
 
 class LogfireAttributes(RootModel[dict[str, Any]]):
@@ -262,7 +267,9 @@ class SuccessStage(BaseModel):
         Why computed vs stored?
             Single source of truth: timestamps are authoritative.
             Can't drift: duration always correct relative to times.
-            Pydantic caches on frozen models: computed once, reused.
+            Not cached: a cached value would survive model_copy(update=...)
+            of the timestamps. Pipeline's summary reads it once per stage,
+            so the subtraction never sits on a repeated-read path.
 
         Returns:
             Milliseconds between start_time and end_time.
@@ -351,7 +358,7 @@ class SkippedStage(BaseModel):
     Represents:
         - Stage intentionally bypassed (not an error)
         - Reason categorized for observability
-        - No execution time (instant decision)
+        - No execution time (instant decision): duration_ms is a 0.0 constant
 
     When to Skip vs Fail?
         Skip: Conditional logic (feature flags, already processed)
@@ -398,6 +405,10 @@ class SkippedStage(BaseModel):
     custom_reason: CustomSkipReason | None = None  # Only with CUSTOM
     timestamp: datetime = Field(default_factory=lambda: datetime.now(UTC))  # When skipped
 
+    # Class-level constant, not a field: every Stage exposes duration_ms, so
+    # aggregations can sum it without branching on the stage type
+    duration_ms: ClassVar[float] = 0.0
+
     model_config = ConfigDict(frozen=True)
 
     @model_validator(mode="after")
@@ -447,6 +458,67 @@ class SkippedStage(BaseModel):
 Stage = SuccessStage | FailedStage | SkippedStage
 
 
+@dataclass(frozen=True, slots=True)
+class _PipelineSummary:
+    """Every Pipeline aggregate, reduced from the stages in a single pass.
+
+    Pipeline's computed properties (and to_logfire_attributes, which reads
+    five of them) each used to walk the stages on their own. Folding them
+    into one loop means one traversal and one status check per stage, and the
+    result is cached on the frozen Pipeline that owns those stages.
+
+    Attributes:
+        success_count: Number of SuccessStage entries
+        error_counts: ErrorCategory → count over FailedStage entries
+        total_duration_ms: Summed duration of executed (success/failed) stages
+        categories: StageCategory of every stage, in execution order
+        latest_success: Most recent SuccessStage, None if there is none
+    """
+
+    success_count: int
+    error_counts: Counter[ErrorCategory]
+    total_duration_ms: float
+    categories: tuple[StageCategory, ...]
+    latest_success: SuccessStage | None
+
+    @classmethod
+    def of(cls, stages: Iterable[Stage]) -> _PipelineSummary:
+        """Reduce stages into a summary with one loop over them."""
+        success_count = 0
+        error_counts: Counter[ErrorCategory] = Counter()
+        total_duration_ms = 0.0
+        categories: list[StageCategory] = []
+        latest_success: SuccessStage | None = None
+        for stage in stages:
+            categories.append(stage.category)
+            total_duration_ms += stage.duration_ms  # SkippedStage contributes 0.0
+            # Dispatch on the discriminator: an identity check against an enum
+            # member, which type checkers narrow just like isinstance
+            if stage.status is StageStatus.SUCCESS:
+                success_count += 1
+                latest_success = stage
+            elif stage.status is StageStatus.FAILED:
+                error_counts[stage.error_category] += 1
+        return cls(success_count, error_counts, total_duration_ms, tuple(categories), latest_success)
+
+    def extend(self, stage: Stage) -> _PipelineSummary:
+        """Summary of the stages plus one more, derived in O(1) from this one.
+
+        Pipeline is append-only, so append() hands the child this delta
+        instead of letting it re-reduce every stage. The error Counter is
+        shared unless the new stage is a failure; nothing mutates it either way.
+        """
+        categories = self.categories + (stage.category,)  # noqa: RUF005 - see Pipeline.append
+        total_duration_ms = self.total_duration_ms + stage.duration_ms  # SkippedStage contributes 0.0
+        if stage.status is StageStatus.SUCCESS:
+            return _PipelineSummary(self.success_count + 1, self.error_counts, total_duration_ms, categories, stage)
+        error_counts = self.error_counts
+        if stage.status is StageStatus.FAILED:
+            error_counts = error_counts.copy()
+            error_counts[stage.error_category] += 1
+        return _PipelineSummary(self.success_count, error_counts, total_duration_ms, categories, self.latest_success)
+
+
 class Pipeline(BaseModel):
     """Immutable pipeline orchestrator tracking multi-stage transformations.
 
@@ -523,8 +595,46 @@ class Pipeline(BaseModel):
 
     stages: tuple[Stage, ...] = ()  # Immutable collection
 
+    # Aggregates: extended incrementally by append(), or computed on first
+    # access for pipelines constructed with stages. Derived state only - kept
+    # out of equality and dropped on copy (see __eq__ / __copy__ below)
+    _summary_cache: _PipelineSummary | None = PrivateAttr(default=None)
+
     model_config = ConfigDict(frozen=True)
 
+    def __eq__(self, other: object) -> bool:
+        """Pipelines are equal when their fields (stages plus any subclass fields) are.
+
+        Pydantic's default also compares private attributes, which would make
+        equality depend on whether the summary cache happens to be filled.
+        """
+        if not isinstance(other, Pipeline):
+            return NotImplemented
+        return type(self) is type(other) and self.__dict__ == other.__dict__
+
+    def __copy__(self) -> Self:
+        """Shallow copy without the summary cache.
+
+        model_copy(update=...) builds on this copy and may replace stages,
+        so a carried-over cache could describe the wrong stages.
+        """
+        copied = super().__copy__()
+        copied._summary_cache = None
+        return copied
+
+    def __deepcopy__(self, memo: dict[int, Any] | None = None) -> Self:
+        """Deep copy without the summary cache (see __copy__)."""
+        copied = super().__deepcopy__(memo)
+        copied._summary_cache = None
+        return copied
+
+    @property
+    def _summary(self) -> _PipelineSummary:
+        """Single-pass aggregate of stages, computed on first access."""
+        if self._summary_cache is None:
+            self._summary_cache = _PipelineSummary.of(self.stages)
+        return self._summary_cache
+
     def append(self, stage: Stage) -> Pipeline:
         """Append stage immutably, returning new Pipeline instance.
 
@@ -552,9 +662,19 @@ class Pipeline(BaseModel):
             >>> pipeline = pipeline.append(stage)  # Reassign to capture new instance
             >>> assert len(pipeline.stages) == 1
         """
-        # Tuple unpacking creates new tuple with appended stage
-        # model_copy returns new Pipeline instance (frozen=True prevents mutation)
-        return self.model_copy(update={"stages": (*self.stages, stage)})
+        # Tuple concatenation: one allocation, copied in C
+        # Fresh instance rather than model_copy: a copy would carry over the
+        # cached summary of the shorter stages tuple
+        # Trusted boundary: existing stages were validated when this pipeline
+        # was built and the new one is a constructed Stage, so skip revalidation
+        # Subclass fields are carried over - model_construct would default them
+        pipeline = type(self).model_construct(
+            _fields_set=self.model_fields_set | {"stages"},
+            **{**self.__dict__, "stages": self.stages + (stage,)},  # noqa: RUF005 - ~2x faster than unpacking
+        )
+        # Extend this pipeline's summary by one stage instead of re-reducing all
+        pipeline._summary_cache = self._summary.extend(stage)
+        return pipeline
 
     @computed_field
     @property
@@ -572,8 +692,7 @@ class Pipeline(BaseModel):
         """
         if not self.stages:
             return False  # Empty pipeline hasn't succeeded
-        # Discriminated union: isinstance narrows to SuccessStage
-        return all(isinstance(stage, SuccessStage) for stage in self.stages)
+        return self._summary.success_count == len(self.stages)
 
     @computed_field
     @property
@@ -588,8 +707,7 @@ class Pipeline(BaseModel):
         Returns:
             True if any stage is FailedStage.
         """
-        # Discriminated union: isinstance narrows to FailedStage
-        return any(isinstance(stage, FailedStage) for stage in self.stages)
+        return bool(self._summary.error_counts)
 
     @computed_field
     @property
@@ -610,11 +728,8 @@ class Pipeline(BaseModel):
             >>> if summary.total_errors > 10:
             ...     alert(f"High error rate: {summary.most_common}")
         """
-        # Extract error categories from failed stages only
-        # Discriminated union: isinstance(stage, FailedStage) guarantees error_category exists
-        errors = [stage.error_category for stage in self.stages if isinstance(stage, FailedStage)]
-        # Counter builds dict[ErrorCategory, int], wrapped in ErrorSummary RootModel
-        return ErrorSummary(dict(Counter(errors)))
+        # Copy out of the cached Counter so the summary can't be mutated through it
+        return ErrorSummary(dict(self._summary.error_counts))
 
     @computed_field
     @property
@@ -632,7 +747,7 @@ class Pipeline(BaseModel):
             Tuple of StageCategory in execution order.
             Empty tuple if no stages.
         """
-        return tuple(stage.category for stage in self.stages)
+        return self._summary.categories
 
     @computed_field
     @property
@@ -642,18 +757,12 @@ class Pipeline(BaseModel):
         Aggregation Logic:
             - SuccessStage: Include duration_ms
             - FailedStage: Include duration_ms (time until failure)
-            - SkippedStage: Exclude (instant decision, no execution)
+            - SkippedStage: Contributes its constant 0.0 (instant decision, no execution)
 
         Returns:
             Total milliseconds spent in executed stages. Zero if no stages.
         """
-        total = 0.0
-        for stage in self.stages:
-            # Discriminated union: isinstance narrows types
-            # Both Success and Failed have duration_ms computed property
-            if isinstance(stage, (SuccessStage, FailedStage)):
-                total += stage.duration_ms
-        return total
+        return self._summary.total_duration_ms
 
     @property
     def latest_stage(self) -> Stage | None:
@@ -672,7 +781,7 @@ class Pipeline(BaseModel):
 
     @property
     def latest_success(self) -> SuccessStage | None:
-        """Most recent successful stage (walks backward from end).
+        """Most recent successful stage (tracked by the summary reduction).
 
         Useful for extracting data after mixed success/skip/fail sequence.
 
@@ -684,11 +793,7 @@ class Pipeline(BaseModel):
             >>> if (success := pipeline.latest_success):
             ...     process(success.data)  # Type-safe: .data exists
         """
-        # Walk backward to find most recent success
-        for stage in reversed(self.stages):
-            if isinstance(stage, SuccessStage):
-                return stage  # Type narrowed to SuccessStage
-        return None
+        return self._summary.latest_success
 
     @property
     def latest_data(self) -> BaseModel:
@@ -745,18 +850,24 @@ class Pipeline(BaseModel):
             ...     if pipeline.failed:
             ...         logfire.error("Pipeline failed", error_count=attrs.root["pipeline.error_summary"])
         """
-        return LogfireAttributes(
+        # Read everything from the one cached summary instead of five properties
+        summary = self._summary
+        total_stages = len(self.stages)
+        # Trusted boundary: every value is derived from already-validated
+        # stages, so skip validating the dict again
+        return LogfireAttributes.model_construct(
             {
                 # Basic metrics
-                "pipeline.total_stages": len(self.stages),
-                "pipeline.succeeded": self.succeeded,  # Computed property
-                "pipeline.failed": self.failed,  # Computed property
-                "pipeline.total_duration_ms": self.total_duration_ms,  # Computed property
+                "pipeline.total_stages": total_stages,
+                "pipeline.succeeded": total_stages > 0 and summary.success_count == total_stages,
+                "pipeline.failed": bool(summary.error_counts),
+                "pipeline.total_duration_ms": summary.total_duration_ms,
                 # Flow visualization: list of stage categories in order
-                "pipeline.stage_flow": [cat.value for cat in self.stage_categories],
+                # (attrgetter does the per-category .value lookup in C)
+                "pipeline.stage_flow": list(map(attrgetter("value"), summary.categories)),
                 # Error distribution: category → count mapping
                 # Convert enum keys to strings for JSON compatibility
-                "pipeline.error_summary": {k.value: v for k, v in self.error_summary.root.items()},
+                "pipeline.error_summary": {k.value: v for k, v in summary.error_counts.items()},
             }
         )
 
@@ -19,12 +19,241 @@ Reference: https://ai.pydantic.dev/tools/
 
 from __future__ import annotations
 
+import ast
+import asyncio
+import math
+import operator
+from collections.abc import Callable
+from functools import lru_cache
+from types import CodeType, MappingProxyType
 from typing import Any
 
 from pydantic_ai import RunContext
 
 from .domain_value import ConversationHistory
 
+# Whitelist of safe binary/unary operators
+# Maps AST node types to their actual operator functions
+_OPERATORS: dict[type[ast.operator | ast.unaryop], Callable[..., Any]] = {
+    ast.Add: operator.add,  # +
+    ast.Sub: operator.sub,  # -
+    ast.Mult: operator.mul,  # *
+    ast.Div: operator.truediv,  # /
+    ast.Pow: operator.pow,  # **
+    ast.USub: operator.neg,  # unary -
+    ast.Mod: operator.mod,  # %
+}
+
+# Whitelist of safe functions and constants
+# These are the ONLY functions/names the LLM can call
+_SAFE_FUNCTIONS: dict[str, Any] = {
+    # Built-in functions
+    "abs": abs,
+    "round": round,
+    "min": min,
+    "max": max,
+    "sum": sum,
+    # Math module functions
+    "sqrt": math.sqrt,
+    "factorial": math.factorial,
+    "log": math.log,
+    "log10": math.log10,
+    "exp": math.exp,
+    "sin": math.sin,
+    "cos": math.cos,
+    "tan": math.tan,
+    # Math constants
+    "pi": math.pi,
+    "e": math.e,
+}
+
+
+# Evaluation namespace: whitelisted names only, builtins stripped
+# Expressions can only load names (Store/Del contexts are rejected by
+# _compile), so sharing one namespace across calls is safe.
+_EVAL_GLOBALS: dict[str, Any] = {"__builtins__": {}, **_SAFE_FUNCTIONS}
+
+# AST node types an expression may contain - anything else is rejected
+_ALLOWED_NODES: tuple[type[ast.AST], ...] = (
+    ast.Expression,
+    ast.Constant,
+    ast.BinOp,
+    ast.UnaryOp,
+    ast.Call,
+    ast.Name,
+    ast.Load,
+    *_OPERATORS,
+)
+
+# Evaluation budgets: literal inputs that would hang a worker for minutes
+_MAX_FACTORIAL_ARG = 1000
+_MAX_POW_DIGITS = 300  # Reject powers whose result exceeds ~10^300
+# _Folded integers past CPython's int-to-str limit can't be returned anyway
+_MAX_INT_BITS = int(4300 / math.log10(2))
+
+# Operators folded statically, so a budget check sees the real exponent or
+# factorial argument rather than an unevaluated subtree
+_FOLDABLE_OPERATORS: dict[type[ast.operator], Callable[[Any, Any], Any]] = {
+    ast.Add: operator.add,
+    ast.Sub: operator.sub,
+    ast.Mult: operator.mul,
+    ast.Div: operator.truediv,
+    ast.Mod: operator.mod,
+}
+
+# Whitelisted functions folded when every argument is itself a literal
+# (sum is left out: it needs an iterable, which no expression can build)
+_FOLDABLE_FUNCTIONS = frozenset(_SAFE_FUNCTIONS) - {"sum", "pi", "e"}
+
+_Folded = dict[ast.AST, int | float | None]
+
+
+def _literal_value(node: ast.expr, folded: _Folded) -> int | float | None:
+    """Statically known value of a numeric literal subtree, or None if dynamic.
+
+    Folds constants, pi/e, negation, arithmetic operators, literal powers and
+    whitelisted calls on literal arguments (powers and factorials budget-checked
+    on the way up), so towers like 2 ** 10 ** 10 or factorial(factorial(20))
+    are caught before anything runs. Results are memoized in ``folded`` so a
+    tree walk folds each subtree once.
+
+    Raises:
+        ValueError: If a folded power, factorial or integer exceeds its
+            budget, or a folded call leaves its math domain
+        ArithmeticError: If folding divides by zero or overflows - the same
+            errors evaluation would raise
+    """
+    if node not in folded:
+        value = _fold(node, folded)
+        if isinstance(value, int) and value.bit_length() > _MAX_INT_BITS:
+            raise ValueError("Integer result exceeds 4300 digits")
+        # Negative base with fractional exponent yields complex - not foldable
+        folded[node] = value if isinstance(value, int | float) else None
+    return folded[node]
+
+
+def _fold(node: ast.expr, folded: _Folded) -> Any:
+    """Evaluate one node of a literal subtree for _literal_value()."""
+    if isinstance(node, ast.Constant) and isinstance(node.value, int | float):
+        return node.value
+
+    if isinstance(node, ast.Name) and isinstance(_SAFE_FUNCTIONS.get(node.id), float):
+        return _SAFE_FUNCTIONS[node.id]
+
+    if isinstance(node, ast.UnaryOp) and isinstance(node.op, ast.USub):
+        operand = _literal_value(node.operand, folded)
+        return None if operand is None else -operand
+
+    if isinstance(node, ast.BinOp) and type(node.op) in _FOLDABLE_OPERATORS:
+        left = _literal_value(node.left, folded)
+        right = _literal_value(node.right, folded)
+        if left is None or right is None:
+            return None
+        return _FOLDABLE_OPERATORS[type(node.op)](left, right)
+
+    if isinstance(node, ast.BinOp) and isinstance(node.op, ast.Pow):
+        base = _literal_value(node.left, folded)
+        exponent = _literal_value(node.right, folded)
+        if base is None or exponent is None:
+            return None
+        # Estimate result magnitude via logarithms instead of computing it
+        if base != 0 and exponent * math.log10(abs(base)) > _MAX_POW_DIGITS:
+            raise ValueError(f"Power too large: result exceeds 10^{_MAX_POW_DIGITS}")
+        return base**exponent
+
+    if (
+        isinstance(node, ast.Call)
+        and isinstance(node.func, ast.Name)
+        and node.func.id in _FOLDABLE_FUNCTIONS
+        and not node.keywords
+    ):
+        args: list[Any] = [_literal_value(arg, folded) for arg in node.args]
+        if not args or None in args:
+            return None
+        if node.func.id == "factorial":
+            if args[0] > _MAX_FACTORIAL_ARG:
+                raise ValueError(f"factorial argument exceeds {_MAX_FACTORIAL_ARG}")
+            # Non-integral arguments are left for math.factorial to reject at runtime
+            if not isinstance(args[0], int) or args[0] < 0:
+                return None
+        return _SAFE_FUNCTIONS[node.func.id](*args)
+
+    return None
+
+
+def _contains_dynamic_power(node: ast.expr, folded: _Folded) -> bool:
+    """Whether a subtree holds a power that didn't fold to a literal."""
+    return any(
+        isinstance(child, ast.BinOp) and isinstance(child.op, ast.Pow) and _literal_value(child, folded) is None
+        for child in ast.walk(node)
+    )
+
+
+@lru_cache(maxsize=256)
+def _compile(expression: str) -> CodeType:
+    """Validate expression AST and compile it to a code object, memoized.
+
+    Walks the parsed tree once and rejects every node outside the whitelist
+    before handing it to CPython's compiler. The resulting bytecode runs the
+    arithmetic in the interpreter loop instead of a recursive Python walker.
+
+    LLMs repeat the same expressions across retries and turns, so the
+    compiled code is cached in-process.
+
+    Raises:
+        SyntaxError: If expression is not valid Python expression syntax
+        ValueError: If expression uses a non-whitelisted operation or name,
+            a factorial argument or exponent that isn't a literal expression,
+            nested powers on a non-literal base, or a factorial/power beyond
+            the evaluation budget
+        ArithmeticError: If a literal subexpression divides by zero or overflows
+    """
+    tree = ast.parse(expression, mode="eval")
+    folded: _Folded = {}
+
+    for node in ast.walk(tree):
+        if not isinstance(node, _ALLOWED_NODES):
+            # Reject anything not explicitly allowed (attributes, comprehensions, lambdas, etc.)
+            raise ValueError(f"Unsupported operation: {type(node)}")
+
+        if isinstance(node, ast.Call):
+            # Security: Only allow simple named functions, no attribute access
+            if not isinstance(node.func, ast.Name):
+                raise ValueError("Only named functions allowed")
+            if node.func.id not in _SAFE_FUNCTIONS:
+                raise ValueError(f"Function {node.func.id} not allowed")
+            if node.keywords:
+                raise ValueError("Keyword arguments not allowed")
+            # Budget: factorial grows super-exponentially in time and memory.
+            # The argument must fold statically - the runtime time limit
+            # can't stop a thread already computing a huge factorial
+            if node.func.id == "factorial" and node.args:
+                if _literal_value(node.args[0], folded) is None:
+                    raise ValueError("factorial argument must be a literal expression")
+                _literal_value(node, folded)
+
+        elif isinstance(node, ast.BinOp) and isinstance(node.op, ast.Pow):
+            # Budget: the exponent must fold statically; with a literal base the
+            # whole power is folded and size-checked, otherwise the exponent
+            # alone is capped since the base's magnitude is unknown - and a
+            # non-literal base may not nest another non-literal power, or the
+            # capped exponents would multiply up the tower
+            exponent = _literal_value(node.right, folded)
+            if exponent is None:
+                raise ValueError("Exponent must be a literal expression")
+            if _literal_value(node.left, folded) is None:
+                if abs(exponent) > _MAX_POW_DIGITS:
+                    raise ValueError(f"Exponent exceeds {_MAX_POW_DIGITS} for a non-literal base")
+                if _contains_dynamic_power(node.left, folded):
+                    raise ValueError("Nested powers on a non-literal base are not allowed")
+            _literal_value(node, folded)
+
+        elif isinstance(node, ast.Name) and node.id not in _SAFE_FUNCTIONS:
+            # Variable/constant names: only pi, e and whitelisted functions
+            raise ValueError(f"Name {node.id} not allowed")
+
+    return compile(tree, "<calculator>", "eval")
+
 
 async def calculator(
     ctx: RunContext[ConversationHistory],
@@ -32,14 +261,15 @@ async def calculator(
 ) -> str:
     """Evaluate Mathematical Expressions Safely.
 
-    Uses Python's AST (Abstract Syntax Tree) module to safely evaluate math
-    expressions without the security risks of eval(). Only allows whitelisted
-    operations and functions.
+    Uses Python's AST (Abstract Syntax Tree) module to validate math
+    expressions before anything runs. Only allows whitelisted operations
+    and functions.
 
     Security Note:
-        Never use eval() or exec() with user input! This tool demonstrates
-        safe evaluation by parsing to AST first, then recursively evaluating
-        only approved nodes.
+        Never eval() or exec() raw user input! This tool demonstrates safe
+        evaluation by parsing to AST first, rejecting every node outside the
+        whitelist, and only then compiling and running the approved tree in
+        a namespace with no builtins.
 
     Use this tool when you need to:
         - Perform arithmetic calculations
@@ -59,103 +289,27 @@ async def calculator(
         >>> await calculator(ctx, "factorial(5)")
         "120"
     """
-    import ast
-    import math
-    import operator
-
-    # Whitelist of safe binary/unary operators
-    # Maps AST node types to their actual operator functions
-    operators = {
-        ast.Add: operator.add,  # +
-        ast.Sub: operator.sub,  # -
-        ast.Mult: operator.mul,  # *
-        ast.Div: operator.truediv,  # /
-        ast.Pow: operator.pow,  # **
-        ast.USub: operator.neg,  # unary -
-        ast.Mod: operator.mod,  # %
-    }
-
-    # Whitelist of safe functions and constants
-    # These are the ONLY functions/names the LLM can call
-    safe_functions = {
-        # Built-in functions
-        "abs": abs,
-        "round": round,
-        "min": min,
-        "max": max,
-        "sum": sum,
-        # Math module functions
-        "sqrt": math.sqrt,
-        "factorial": math.factorial,
-        "log": math.log,
-        "log10": math.log10,
-        "exp": math.exp,
-        "sin": math.sin,
-        "cos": math.cos,
-        "tan": math.tan,
-        # Math constants
-        "pi": math.pi,
-        "e": math.e,
-    }
-
-    def eval_expr(node: ast.expr) -> Any:
-        """Recursively Evaluate AST Expression Node.
-
-        This function walks the AST and evaluates only approved node types.
-        Any unapproved operation raises ValueError, preventing code injection.
-        """
-        if isinstance(node, ast.Constant):
-            # Literal values: 5, 3.14, "text" (though we expect numbers)
-            return node.value
-
-        elif isinstance(node, ast.BinOp):
-            # Binary operations: a + b, a * b, etc.
-            # Recursively evaluate left and right operands, then apply operator
-            left_val = eval_expr(node.left)
-            right_val = eval_expr(node.right)
-            op_func = operators[type(node.op)]
-            return op_func(left_val, right_val)  # type: ignore[operator]
-
-        elif isinstance(node, ast.UnaryOp):
-            # Unary operations: -x, +x
-            operand_val = eval_expr(node.operand)
-            op_func = operators[type(node.op)]
-            return op_func(operand_val)  # type: ignore[operator]
-
-        elif isinstance(node, ast.Call):
-            # Function calls: sqrt(16), factorial(5)
-            # Security: Only allow simple named functions, no attribute access
-            if not isinstance(node.func, ast.Name):
-                raise ValueError("Only named functions allowed")
-
-            func_name = node.func.id
-            if func_name not in safe_functions:
-                raise ValueError(f"Function {func_name} not allowed")
-
-            # Recursively evaluate arguments
-            args = [eval_expr(arg) for arg in node.args]
-            return safe_functions[func_name](*args)  # type: ignore[operator]
-
-        elif isinstance(node, ast.Name):
-            # Variable/constant names: pi, e
-            if node.id in safe_functions:
-                return safe_functions[node.id]
-            raise ValueError(f"Name {node.id} not allowed")
-
-        else:
-            # Reject anything not explicitly allowed (list comprehensions, imports, etc.)
-            raise ValueError(f"Unsupported operation: {type(node)}")
+    from ..config import settings
 
     try:
-        # Parse expression string into AST (raises SyntaxError if invalid)
-        tree = ast.parse(expression, mode="eval")
-
-        # Evaluate the parsed AST recursively
-        result = eval_expr(tree.body)
+        # Parse, validate and compile (cached; raises SyntaxError/ValueError if invalid)
+        code = _compile(expression)
+
+        # Run validated bytecode against the whitelist namespace only, off the
+        # event loop so a slow expression can't stall concurrent agent turns.
+        # A timed-out thread can't be killed - it runs to completion in the
+        # background - so the static budget in _compile() remains the main guard.
+        result = await asyncio.wait_for(
+            asyncio.to_thread(eval, code, _EVAL_GLOBALS),
+            timeout=settings.calculator_timeout_s,
+        )
 
         # Return as string for LLM to parse
         return str(result)
 
+    except TimeoutError:
+        return "Error: expression exceeded time limit"
+
     except Exception as e:
         # Return error message instead of raising - LLM can retry or explain to user
         return f"Error evaluating expression: {e}"
@@ -232,10 +386,15 @@ async def tavily_search(
 
 
 # Tool Registry - All Available Tools for Agent Use
-# Used by ToolClassifier to validate tool selections and by ModelPool for registration
-ALL_TOOLS = {
-    "calculator": calculator,
-    "tavily_search": tavily_search,
-}
+# Read-only view: used by ModelPool for registration; nothing can add or swap tools at runtime
+ALL_TOOLS: MappingProxyType[str, Callable[..., Any]] = MappingProxyType(
+    {
+        "calculator": calculator,
+        "tavily_search": tavily_search,
+    }
+)
+
+# Tool name set: used by ToolClassifier and ModelPool for membership checks and cache keys
+ALL_TOOL_NAMES: frozenset[str] = frozenset(ALL_TOOLS)
 
-__all__ = ["ALL_TOOLS", "calculator", "tavily_search"]
+__all__ = ["ALL_TOOLS", "ALL_TOOL_NAMES", "calculator", "tavily_search"]
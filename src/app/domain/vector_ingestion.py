@@ -30,18 +30,50 @@ See Also:
 
 from __future__ import annotations
 
+import asyncio
+import json
+from collections.abc import AsyncIterable
+from datetime import UTC, datetime, timedelta
 from enum import StrEnum
-from typing import TYPE_CHECKING
-
-from pydantic import BaseModel, ConfigDict, Field, RootModel
-from qdrant_client.models import Payload, SparseVector, VectorStruct
-
-from .pipeline import Pipeline
+from hashlib import blake2b
+from time import perf_counter_ns
+from typing import TYPE_CHECKING, Annotated, Any, Self
+
+import numpy as np
+from numpy.typing import NDArray
+from pydantic import (
+    BaseModel,
+    ConfigDict,
+    GetCoreSchemaHandler,
+    RootModel,
+    StringConstraints,
+    TypeAdapter,
+    WithJsonSchema,
+    field_serializer,
+    field_validator,
+)
+from pydantic_core import CoreSchema, core_schema
+from qdrant_client.models import (
+    BinaryQuantization,
+    BinaryQuantizationConfig,
+    Payload,
+    PointStruct,
+    ScalarQuantization,
+    ScalarQuantizationConfig,
+    ScalarType,
+    SparseVector,
+    VectorStruct,
+)
+
+from .domain_type import ErrorCategory, StageCategory, StageStatus
+from .pipeline import ErrorMessage, FailedStage, Pipeline, SuccessStage
 
 if TYPE_CHECKING:
-    from qdrant_client import QdrantClient
+    from fastembed import SparseEmbedding, SparseTextEmbedding
+    from ollama import AsyncClient as OllamaClient
+    from qdrant_client import AsyncQdrantClient
 
-    from .pipeline import FailedStage, StageName, SuccessStage
+    from .pipeline import StageName
 
 
 class VectorType(StrEnum):
@@ -72,49 +104,109 @@ class VectorType(StrEnum):
         ...     VectorType.DENSE.value: [0.1, 0.2, ...],
         ...     VectorType.SPARSE.value: SparseVector(...)
         ... }
-        >>> point = PointStruct(id=uuid, vector=vector_dict, payload={...})
+        >>> point = PointStruct(id=point_id, vector=vector_dict, payload={...})
     """
 
     DENSE = "dense"
     SPARSE = "sparse"
 
 
-class DenseEmbeddingModel(RootModel[str]):
+class QuantizationMode(StrEnum):
+    """Server-side compression for stored dense vectors.
+
+    Qdrant quantizes vectors itself when the collection is configured for it:
+    the quantized copy stays in RAM for scoring while float32 originals move to
+    disk for optional rescoring. Ingestion keeps sending float32 - no client-side
+    scale bookkeeping, and switching modes never requires re-embedding.
+
+    Modes:
+        NONE: float32 only (4 bytes per dimension)
+        INT8: Scalar quantization, 4x smaller, <1% recall loss on modern embeddings
+        BINARY: 1 bit per dimension, 32x smaller; pair with oversampling + rescore
+
+    Example:
+        >>> qdrant.create_collection(
+        ...     collection_name="documents",
+        ...     vectors_config={VectorType.DENSE.value: VectorParams(size=768, distance=Distance.COSINE)},
+        ...     quantization_config=QuantizationMode.INT8.quantization_config(),
+        ... )
+    """
+
+    NONE = "none"
+    INT8 = "int8"
+    BINARY = "binary"
+
+    def quantization_config(self) -> ScalarQuantization | BinaryQuantization | None:
+        """Qdrant collection quantization config for this mode (None for NONE)."""
+        match self:
+            case QuantizationMode.INT8:
+                # quantile=0.99 clips outliers so they don't stretch the int8 range
+                return ScalarQuantization(
+                    scalar=ScalarQuantizationConfig(type=ScalarType.INT8, quantile=0.99, always_ram=True)
+                )
+            case QuantizationMode.BINARY:
+                return BinaryQuantization(binary=BinaryQuantizationConfig(always_ram=True))
+            case QuantizationMode.NONE:
+                return None
+
+
+# Built once: validating through a module-level adapter avoids per-call schema setup
+_MODEL_NAME_ADAPTER: TypeAdapter[str] = TypeAdapter(Annotated[str, StringConstraints(min_length=1, max_length=200)])
+
+
+class _EmbeddingModelName(str):
+    """Validated embedding model identifier - a plain str at runtime.
+
+    Construction validates length (raises ValidationError, like a RootModel),
+    but the result is the string itself: no wrapper allocation and no .root
+    unwrapping before handing it to Ollama or FastEmbed.
+    """
+
+    __slots__ = ()
+
+    def __new__(cls, value: str) -> Self:
+        return super().__new__(cls, _MODEL_NAME_ADAPTER.validate_python(value))
+
+    @classmethod
+    def __get_pydantic_core_schema__(cls, source: Any, handler: GetCoreSchemaHandler) -> CoreSchema:
+        """Validate through __new__ when used as a Pydantic field type."""
+        return core_schema.no_info_after_validator_function(cls, handler(str))
+
+
+class DenseEmbeddingModel(_EmbeddingModelName):
     """Semantic embedding model identifier for dense vectors.
 
     Wraps model identifier string to provide:
         - Type safety: Can't accidentally mix with sparse model identifiers
         - Validation: Enforces non-empty, reasonable length
         - Semantic meaning: Clear this is for dense/semantic embeddings
-        - Observability: Logfire displays as domain type, not generic string
 
     Common Models:
         - "text-embedding-3-small" (OpenAI, 1536 dims)
         - "text-embedding-3-large" (OpenAI, 3072 dims)
         - "embed-english-v3.0" (Cohere)
 
-    Why RootModel?
-        Same pattern as StageName, MessageId - wraps primitive with
-        domain validation and type distinction in traces.
+    Why a str subclass instead of RootModel?
+        Model names are passed straight to embedding clients on the hot ingest
+        path. Subclassing str keeps the type distinction and validation while
+        the value itself is usable anywhere a string is.
 
     Example:
         >>> model = DenseEmbeddingModel("text-embedding-3-small")
-        >>> print(model.root)  # "text-embedding-3-small"
+        >>> print(model)  # "text-embedding-3-small"
         >>> # Type-safe: can't pass SparseEmbeddingModel where DenseEmbeddingModel expected
     """
 
-    root: str = Field(min_length=1, max_length=200)
-    model_config = ConfigDict(frozen=True)
+    __slots__ = ()
 
 
-class SparseEmbeddingModel(RootModel[str]):
+class SparseEmbeddingModel(_EmbeddingModelName):
     """Sparse embedding model identifier for keyword-based vectors.
 
     Wraps model identifier string to provide:
         - Type safety: Can't accidentally mix with dense model identifiers
         - Validation: Enforces non-empty, reasonable length
         - Semantic meaning: Clear this is for sparse/keyword embeddings
-        - Observability: Logfire displays as domain type, not generic string
 
     Common Models:
         - "bm25" (Classic IR algorithm)
@@ -127,12 +219,11 @@ class SparseEmbeddingModel(RootModel[str]):
 
     Example:
         >>> model = SparseEmbeddingModel("bm25")
-        >>> print(model.root)  # "bm25"
+        >>> print(model)  # "bm25"
         >>> # Type-safe: can't pass DenseEmbeddingModel where SparseEmbeddingModel expected
     """
 
-    root: str = Field(min_length=1, max_length=200)
-    model_config = ConfigDict(frozen=True)
+    __slots__ = ()
 
 
 class HybridEmbedding(BaseModel):
@@ -143,12 +234,13 @@ class HybridEmbedding(BaseModel):
 
     Attributes:
         text: Original text that was embedded
-        dense: Dense embedding vector (always present)
+        dense: Dense embedding vector as float32 ndarray (always present)
         sparse: Sparse embedding vector (optional, using Qdrant's SparseVector)
 
     Why this design?
         - Type-safe: Uses Qdrant's SparseVector type directly
         - Efficient: Sparse vectors stored in compressed format (indices/values)
+        - Compact: Dense vectors held as contiguous float32, not boxed Python floats
         - Flexible: Supports dense-only or hybrid (dense + sparse)
         - Composable: Ready for Qdrant PointStruct construction
 
@@ -176,10 +268,52 @@ class HybridEmbedding(BaseModel):
     """
 
     text: str
-    dense: list[float]
+    # ndarray has no JSON schema of its own; it serializes as a list of floats
+    dense: Annotated[NDArray[np.float32], WithJsonSchema({"type": "array", "items": {"type": "number"}})]
     sparse: SparseVector | None = None
 
-    model_config = ConfigDict(frozen=True)
+    model_config = ConfigDict(frozen=True, arbitrary_types_allowed=True)
+
+    def __eq__(self, other: object) -> bool:
+        """Field-wise equality, comparing dense vectors element-wise.
+
+        Pydantic's default compares field values with ==, which on ndarrays
+        yields an array whose truth value is ambiguous - so comparing two
+        embeddings (or stages and pipelines holding them) would raise.
+        """
+        if not isinstance(other, HybridEmbedding):
+            return NotImplemented
+        return self.text == other.text and self.sparse == other.sparse and np.array_equal(self.dense, other.dense)
+
+    __hash__ = None  # type: ignore[assignment]  # ndarray field: never hashable
+
+    @field_validator("dense", mode="before")
+    @classmethod
+    def coerce_dense_to_float32(cls, value: Any) -> NDArray[np.float32]:
+        """Coerce list or array input to a contiguous float32 array.
+
+        Embedding providers return Python lists (float64 boxed values).
+        float32 halves the footprint and keeps vector math in NumPy.
+        """
+        return np.asarray(value, dtype=np.float32)
+
+    @field_serializer("dense")
+    def serialize_dense(self, dense: NDArray[np.float32]) -> list[float]:
+        """Serialize dense vector as a plain list for JSON and Qdrant payloads."""
+        return dense.tolist()  # type: ignore[no-any-return]
+
+    def normalize(self) -> HybridEmbedding:
+        """Return a copy with the dense vector L2-normalized.
+
+        Needed before upserting into dot-product collections, where vector
+        length skews scores. Cosine collections normalize server-side, so
+        _create_upsert_stage does not call this implicitly.
+
+        Returns:
+            New HybridEmbedding with unit-length dense vector (sparse unchanged).
+        """
+        norm = np.linalg.norm(self.dense)
+        return self.model_copy(update={"dense": self.dense / (norm + 1e-12)})
 
     @property
     def is_hybrid(self) -> bool:
@@ -191,6 +325,83 @@ class HybridEmbedding(BaseModel):
         return self.sparse is not None
 
 
+class HybridEmbeddingBatch(RootModel[tuple[HybridEmbedding, ...]]):
+    """Ordered embeddings produced by one batched embedding call.
+
+    Stage data must be a BaseModel, so batched stages return this wrapper
+    rather than a bare tuple. Order matches the input texts.
+
+    Example:
+        >>> batch = stage.data
+        >>> for embedding in batch.root:
+        ...     print(embedding.text, embedding.dense.shape)
+    """
+
+    root: tuple[HybridEmbedding, ...]
+
+    model_config = ConfigDict(frozen=True)
+
+
+def _to_sparse_vector(fastembed_sparse: SparseEmbedding) -> SparseVector:
+    """Convert FastEmbed's int/float arrays to Qdrant's SparseVector.
+
+    Each array becomes a list in one C-level tolist() call. model_construct
+    then skips Qdrant's per-element StrictInt/StrictFloat checks, which
+    ONNX output already satisfies - that validation costs more than the
+    conversion for SPLADE's hundreds of non-zeros per text.
+
+    The arrays are not passed through as-is: qdrant-client's gRPC conversion
+    iterates them element by element (slower on numpy scalars than on a list),
+    and the REST/JSON path cannot serialize an ndarray at all.
+    """
+    return SparseVector.model_construct(
+        indices=fastembed_sparse.indices.tolist(),
+        values=fastembed_sparse.values.tolist(),
+    )
+
+
+def _point_id(text: str, payload: Payload) -> int:
+    """Deterministic Qdrant point id for a piece of content.
+
+    Hashes the text with its canonical-JSON payload, so retrying an ingestion
+    upserts onto the same points instead of duplicating them, while identical
+    text under different metadata (e.g. another conversation) stays distinct.
+    Integer ids are cheaper than UUID strings on the wire and in Qdrant's id
+    index; the shift keeps the 64-bit digest inside Qdrant's unsigned range.
+    """
+    digest = blake2b(text.encode(), digest_size=8)
+    digest.update(b"\0")
+    digest.update(json.dumps(payload, sort_keys=True, separators=(",", ":"), default=str).encode())
+    return int.from_bytes(digest.digest(), "big") >> 1
+
+
+# Named-vector keys resolved once as plain str, not an enum attribute lookup per point
+_DENSE_KEY = VectorType.DENSE.value
+_SPARSE_KEY = VectorType.SPARSE.value
+
+
+def _named_vectors(embedding: HybridEmbedding) -> VectorStruct:
+    """Named-vector dict for one point, keyed by VectorType for hybrid search.
+
+    Each schema (dense-only or hybrid) is a single dict literal, built in one
+    step instead of grown key by key. The dense ndarray converts to a plain
+    list only here, at the Qdrant boundary.
+    """
+    if embedding.sparse is None:
+        return {_DENSE_KEY: embedding.dense.tolist()}
+    return {_DENSE_KEY: embedding.dense.tolist(), _SPARSE_KEY: embedding.sparse}
+
+
+def _stage_window(t0_ns: int) -> tuple[datetime, datetime]:
+    """Stage start/end datetimes from a perf_counter_ns() start mark.
+
+    Reads the wall clock once at stage end and derives the start from the
+    monotonic elapsed time, so durations stay exact even if the clock steps.
+    """
+    end = datetime.now(UTC)
+    return end - timedelta(microseconds=(perf_counter_ns() - t0_ns) / 1000), end
+
+
 class VectorIngestion(BaseModel):
     """Minimal base for vector ingestion pipelines.
 
@@ -211,6 +422,12 @@ class VectorIngestion(BaseModel):
         Base class provides infrastructure (pipeline tracking, embedding generation).
         Concrete classes provide domain semantics (what to embed, what metadata to store).
 
+    Trusted Boundaries:
+        Helpers build HybridEmbedding, SuccessStage and PointStruct with
+        model_construct. Every field comes from this module or a vendor client,
+        so revalidating would only repeat checks; validation stays at the API
+        edge where untrusted input enters.
+
     Concrete Class Responsibilities:
         1. Define domain-specific fields (IDs, metadata types)
         2. Implement factory method that orchestrates stages
@@ -240,6 +457,7 @@ class VectorIngestion(BaseModel):
         self,
         text: str,
         model: DenseEmbeddingModel,
+        ollama: OllamaClient,
         stage_name: StageName,
     ) -> SuccessStage | FailedStage:
         """Generate dense embedding via Ollama.
@@ -250,37 +468,90 @@ class VectorIngestion(BaseModel):
         Args:
             text: Text to embed
             model: Dense embedding model identifier (e.g., "nomic-embed-text")
+            ollama: Async Ollama client (StorageService.get_embedding_client)
             stage_name: Name for this stage in pipeline
 
         Returns:
             SuccessStage with HybridEmbedding or FailedStage with error
         """
-        from datetime import UTC, datetime
+        t0 = perf_counter_ns()
+        try:
+            response = await ollama.embeddings(model=model, prompt=text)
+            dense_vector = np.asarray(response["embedding"], dtype=np.float32)
 
-        from .domain_type import ErrorCategory, StageCategory, StageStatus
-        from .pipeline import ErrorMessage, FailedStage, SuccessStage
+            # model_construct skips validation: Ollama output is trusted and
+            # already coerced to float32 above, so revalidating is pure overhead
+            embedding = HybridEmbedding.model_construct(text=text, dense=dense_vector, sparse=None)
 
-        start = datetime.now(UTC)
-        try:
-            import ollama
+            start, end = _stage_window(t0)
+            return SuccessStage.model_construct(
+                status=StageStatus.SUCCESS,
+                category=StageCategory.ENRICHMENT,
+                name=stage_name,
+                data=embedding,
+                start_time=start,
+                end_time=end,
+            )
+        except Exception as e:
+            start, end = _stage_window(t0)
+            return FailedStage(
+                status=StageStatus.FAILED,
+                category=StageCategory.ENRICHMENT,
+                error_category=ErrorCategory.EXTERNAL_SERVICE,
+                name=stage_name,
+                error=ErrorMessage(str(e)),
+                start_time=start,
+                end_time=end,
+            )
+
+    async def _create_dense_embedding_batch_stage(
+        self,
+        texts: list[str],
+        model: DenseEmbeddingModel,
+        ollama: OllamaClient,
+        stage_name: StageName,
+    ) -> SuccessStage | FailedStage:
+        """Generate dense embeddings for many texts in one Ollama request.
 
-            from ..config import settings
+        Ollama's embed endpoint accepts a list of inputs, so N texts cost one
+        round-trip and one model warmup instead of N. Prefer this over calling
+        _create_dense_embedding_stage in a loop when ingesting messages or chunks.
 
-            client = ollama.Client(host=settings.ollama_base_url)
-            response = client.embeddings(model=model.root, prompt=text)
-            dense_vector = response["embedding"]
+        Args:
+            texts: Texts to embed (order preserved in output)
+            model: Dense embedding model identifier (e.g., "nomic-embed-text")
+            ollama: Async Ollama client (StorageService.get_embedding_client)
+            stage_name: Name for this stage in pipeline
 
-            embedding = HybridEmbedding(text=text, dense=dense_vector)
+        Returns:
+            SuccessStage with HybridEmbeddingBatch or FailedStage with error
+        """
+        t0 = perf_counter_ns()
+        try:
+            response = await ollama.embed(model=model, input=texts)
+
+            batch = HybridEmbeddingBatch.model_construct(
+                root=tuple(
+                    HybridEmbedding.model_construct(
+                        text=text,
+                        dense=np.asarray(vector, dtype=np.float32),
+                        sparse=None,
+                    )
+                    for text, vector in zip(texts, response["embeddings"], strict=True)
+                )
+            )
 
-            return SuccessStage(
+            start, end = _stage_window(t0)
+            return SuccessStage.model_construct(
                 status=StageStatus.SUCCESS,
                 category=StageCategory.ENRICHMENT,
                 name=stage_name,
-                data=embedding,
+                data=batch,
                 start_time=start,
-                end_time=datetime.now(UTC),
+                end_time=end,
             )
         except Exception as e:
+            start, end = _stage_window(t0)
             return FailedStage(
                 status=StageStatus.FAILED,
                 category=StageCategory.ENRICHMENT,
@@ -288,13 +559,13 @@ class VectorIngestion(BaseModel):
                 name=stage_name,
                 error=ErrorMessage(str(e)),
                 start_time=start,
-                end_time=datetime.now(UTC),
+                end_time=end,
             )
 
     async def _create_sparse_embedding_stage(
         self,
         text: str,
-        model: SparseEmbeddingModel,
+        encoder: SparseTextEmbedding,
         stage_name: StageName,
     ) -> SuccessStage | FailedStage:
         """Generate sparse embedding via FastEmbed SPLADE.
@@ -302,50 +573,100 @@ class VectorIngestion(BaseModel):
         Uses Qdrant's FastEmbed library with SPLADE model (ONNX runtime).
         Avoids heavy transformers/PyTorch dependencies while maintaining quality.
 
-        Returns HybridEmbedding with empty dense vector—designed to be composed
-        with _create_dense_embedding_stage in concrete implementations.
+        Returns HybridEmbedding with empty dense vector. To get both vectors,
+        use _create_hybrid_embedding_stage instead of composing the two stages.
 
         Args:
             text: Text to embed
-            model: Sparse embedding model identifier (e.g., "prithivida/Splade_PP_en_v1")
+            encoder: Loaded SPLADE model (StorageService.get_sparse_model)
             stage_name: Name for this stage in pipeline
 
         Returns:
             SuccessStage with HybridEmbedding or FailedStage with error
         """
-        from datetime import UTC, datetime
+        t0 = perf_counter_ns()
+        try:
+            # FastEmbed batches even single inputs; the only result is at index 0
+            # ONNX inference runs on a worker thread so the event loop stays free
+            sparse_embeddings = await asyncio.to_thread(lambda: list(encoder.embed([text])))
 
-        from .domain_type import ErrorCategory, StageCategory, StageStatus
-        from .pipeline import ErrorMessage, FailedStage, SuccessStage
+            # Empty dense vector: concrete classes combine with dense stage
+            # model_construct skips validation: FastEmbed output is trusted
+            embedding = HybridEmbedding.model_construct(
+                text=text,
+                dense=np.empty(0, dtype=np.float32),
+                sparse=_to_sparse_vector(sparse_embeddings[0]),
+            )
 
-        start = datetime.now(UTC)
-        try:
-            from fastembed import SparseTextEmbedding
+            start, end = _stage_window(t0)
+            return SuccessStage.model_construct(
+                status=StageStatus.SUCCESS,
+                category=StageCategory.ENRICHMENT,
+                name=stage_name,
+                data=embedding,
+                start_time=start,
+                end_time=end,
+            )
+        except Exception as e:
+            start, end = _stage_window(t0)
+            return FailedStage(
+                status=StageStatus.FAILED,
+                category=StageCategory.ENRICHMENT,
+                error_category=ErrorCategory.EXTERNAL_SERVICE,
+                name=stage_name,
+                error=ErrorMessage(str(e)),
+                start_time=start,
+                end_time=end,
+            )
 
-            embedding_model = SparseTextEmbedding(model_name=model.root)
-            sparse_embeddings = list(embedding_model.embed([text]))
+    async def _create_hybrid_embedding_stage(
+        self,
+        text: str,
+        dense_model: DenseEmbeddingModel,
+        ollama: OllamaClient,
+        encoder: SparseTextEmbedding,
+        stage_name: StageName,
+    ) -> SuccessStage | FailedStage:
+        """Generate dense and sparse embeddings concurrently as one HybridEmbedding.
 
-            # FastEmbed batches even single inputs; extract the only result
-            fastembed_sparse = sparse_embeddings[0]
+        The Ollama request is awaited while SPLADE inference runs on a worker
+        thread, so wall-clock cost is the slower of the two rather than their sum.
+        One stage and one HybridEmbedding replace the dense-only and sparse-only
+        placeholders that would otherwise need merging downstream.
 
-            # Convert FastEmbed's sparse format to Qdrant's SparseVector
-            sparse_vec = SparseVector(
-                indices=fastembed_sparse.indices.tolist(),
-                values=fastembed_sparse.values.tolist(),
-            )
+        Args:
+            text: Text to embed
+            dense_model: Dense embedding model identifier (e.g., "nomic-embed-text")
+            ollama: Async Ollama client (StorageService.get_embedding_client)
+            encoder: Loaded SPLADE model (StorageService.get_sparse_model)
+            stage_name: Name for this stage in pipeline
 
-            # Empty dense vector: concrete classes combine with dense stage
-            embedding = HybridEmbedding(text=text, dense=[], sparse=sparse_vec)
+        Returns:
+            SuccessStage with hybrid HybridEmbedding or FailedStage with error
+        """
+        t0 = perf_counter_ns()
+        try:
+            dense_response, sparse_embeddings = await asyncio.gather(
+                ollama.embeddings(model=dense_model, prompt=text),
+                asyncio.to_thread(lambda: list(encoder.embed([text]))),
+            )
+            embedding = HybridEmbedding.model_construct(
+                text=text,
+                dense=np.asarray(dense_response["embedding"], dtype=np.float32),
+                sparse=_to_sparse_vector(sparse_embeddings[0]),
+            )
 
-            return SuccessStage(
+            start, end = _stage_window(t0)
+            return SuccessStage.model_construct(
                 status=StageStatus.SUCCESS,
                 category=StageCategory.ENRICHMENT,
                 name=stage_name,
                 data=embedding,
                 start_time=start,
-                end_time=datetime.now(UTC),
+                end_time=end,
             )
         except Exception as e:
+            start, end = _stage_window(t0)
             return FailedStage(
                 status=StageStatus.FAILED,
                 category=StageCategory.ENRICHMENT,
@@ -353,68 +674,158 @@ class VectorIngestion(BaseModel):
                 name=stage_name,
                 error=ErrorMessage(str(e)),
                 start_time=start,
-                end_time=datetime.now(UTC),
+                end_time=end,
+            )
+
+    async def _create_sparse_embedding_batch_stage(
+        self,
+        texts: list[str],
+        encoder: SparseTextEmbedding,
+        stage_name: StageName,
+        batch_size: int = 32,
+    ) -> SuccessStage | FailedStage:
+        """Generate sparse embeddings for many texts via FastEmbed SPLADE.
+
+        FastEmbed runs each batch_size slice through one ONNX session call,
+        amortizing tokenization and kernel launch overhead across texts.
+        Like _create_sparse_embedding_stage, dense vectors are left empty.
+
+        Args:
+            texts: Texts to embed (order preserved in output)
+            encoder: Loaded SPLADE model (StorageService.get_sparse_model)
+            stage_name: Name for this stage in pipeline
+            batch_size: Texts per ONNX inference call
+
+        Returns:
+            SuccessStage with HybridEmbeddingBatch or FailedStage with error
+        """
+        t0 = perf_counter_ns()
+        try:
+            # ONNX inference runs on a worker thread so the event loop stays free
+            sparse_embeddings = await asyncio.to_thread(lambda: list(encoder.embed(texts, batch_size=batch_size)))
+            empty_dense = np.empty(0, dtype=np.float32)
+
+            batch = HybridEmbeddingBatch.model_construct(
+                root=tuple(
+                    HybridEmbedding.model_construct(
+                        text=text,
+                        dense=empty_dense,
+                        sparse=_to_sparse_vector(fastembed_sparse),
+                    )
+                    for text, fastembed_sparse in zip(texts, sparse_embeddings, strict=True)
+                )
+            )
+
+            start, end = _stage_window(t0)
+            return SuccessStage.model_construct(
+                status=StageStatus.SUCCESS,
+                category=StageCategory.ENRICHMENT,
+                name=stage_name,
+                data=batch,
+                start_time=start,
+                end_time=end,
+            )
+        except Exception as e:
+            start, end = _stage_window(t0)
+            return FailedStage(
+                status=StageStatus.FAILED,
+                category=StageCategory.ENRICHMENT,
+                error_category=ErrorCategory.EXTERNAL_SERVICE,
+                name=stage_name,
+                error=ErrorMessage(str(e)),
+                start_time=start,
+                end_time=end,
             )
 
     async def _create_upsert_stage(
         self,
         embedding: HybridEmbedding,
         payload: Payload,
-        qdrant: QdrantClient,
+        qdrant: AsyncQdrantClient,
         collection: str,
         stage_name: StageName,
     ) -> SuccessStage | FailedStage:
         """Upsert hybrid embedding to Qdrant.
 
+        Single-point convenience over _create_upsert_batch_stage. When ingesting
+        many embeddings, call the batch stage directly - one request per batch.
+
+        Args:
+            embedding: HybridEmbedding with dense and optionally sparse vectors
+            payload: Qdrant payload dict (JSON-serializable metadata)
+            qdrant: Async Qdrant client instance
+            collection: Target collection name
+            stage_name: Name for this stage in pipeline
+
+        Returns:
+            SuccessStage with UpdateResult or FailedStage with error
+        """
+        return await self._create_upsert_batch_stage(
+            points=[(embedding, payload)],
+            qdrant=qdrant,
+            collection=collection,
+            stage_name=stage_name,
+        )
+
+    async def _create_upsert_batch_stage(
+        self,
+        points: list[tuple[HybridEmbedding, Payload]],
+        qdrant: AsyncQdrantClient,
+        collection: str,
+        stage_name: StageName,
+        wait: bool = True,
+    ) -> SuccessStage | FailedStage:
+        """Upsert many hybrid embeddings to Qdrant in one request.
+
         Constructs PointStruct with named vectors for hybrid search (dense + sparse).
         Named vectors enable Qdrant's RRF/DBSF fusion and per-vector filtering.
+        Batching amortizes the round-trip, WAL append and sparse index update
+        across all points; keep batches to a few hundred points per call.
 
         Point Structure:
-            - id: Random UUID (no deduplication - create new point per ingestion)
+            - id: 63-bit hash of text + payload (re-ingesting the same content overwrites, not duplicates)
             - vector: Named dict mapping VectorType to embeddings
             - payload: Domain metadata for filtering and display
 
         Args:
-            embedding: HybridEmbedding with dense and optionally sparse vectors
-            payload: Qdrant payload dict (JSON-serializable metadata)
-            qdrant: Qdrant client instance
+            points: (embedding, payload) pairs to store
+            qdrant: Async Qdrant client instance
             collection: Target collection name
             stage_name: Name for this stage in pipeline
+            wait: Block until points are indexed. Pass False for bulk loads that
+                don't read back immediately - Qdrant then acknowledges after the
+                WAL append and the next batch can be sent sooner.
 
         Returns:
             SuccessStage with UpdateResult or FailedStage with error
         """
-        from datetime import UTC, datetime
-        from uuid import uuid4
-
-        from .domain_type import ErrorCategory, StageCategory, StageStatus
-        from .pipeline import ErrorMessage, FailedStage, SuccessStage
-
-        start = datetime.now(UTC)
+        t0 = perf_counter_ns()
         try:
-            from qdrant_client.models import PointStruct
-
-            # Named vectors: keys match VectorType enum for hybrid search
-            vector_dict: dict[str, list[float] | SparseVector] = {VectorType.DENSE.value: embedding.dense}
-
-            if embedding.is_hybrid and embedding.sparse:
-                vector_dict[VectorType.SPARSE.value] = embedding.sparse
-
-            # VectorStruct is Qdrant's union type for single/multi/named vectors
-            vectors: VectorStruct = vector_dict  # type: ignore[assignment]
-
-            point = PointStruct(id=str(uuid4()), vector=vectors, payload=payload)
-            result = qdrant.upsert(collection_name=collection, points=[point])
-
-            return SuccessStage(
+            point_list: list[PointStruct] = []
+            for embedding, payload in points:
+                # model_construct skips validation: every field was just built here from
+                # trusted stage output, and revalidating 768+ floats costs ~5x the build
+                point_list.append(
+                    PointStruct.model_construct(
+                        id=_point_id(embedding.text, payload),
+                        vector=_named_vectors(embedding),
+                        payload=payload,
+                    )
+                )
+
+            result = await qdrant.upsert(collection_name=collection, points=point_list, wait=wait)
+
+            start, end = _stage_window(t0)
+            return SuccessStage.model_construct(
                 status=StageStatus.SUCCESS,
                 category=StageCategory.PERSISTENCE,
                 name=stage_name,
                 data=result,  # Qdrant's UpdateResult type
                 start_time=start,
-                end_time=datetime.now(UTC),
+                end_time=end,
             )
         except Exception as e:
+            start, end = _stage_window(t0)
             return FailedStage(
                 status=StageStatus.FAILED,
                 category=StageCategory.PERSISTENCE,
@@ -422,13 +833,121 @@ class VectorIngestion(BaseModel):
                 name=stage_name,
                 error=ErrorMessage(str(e)),
                 start_time=start,
-                end_time=datetime.now(UTC),
+                end_time=end,
+            )
+
+    async def _create_streaming_ingest_stages(
+        self,
+        items: AsyncIterable[tuple[str, Payload]],
+        dense_model: DenseEmbeddingModel,
+        ollama: OllamaClient,
+        encoder: SparseTextEmbedding | None,
+        qdrant: AsyncQdrantClient,
+        collection: str,
+        stage_name: StageName,
+        batch_size: int = 128,
+        flush_interval_s: float = 0.5,
+        queue_size: int = 32,
+    ) -> tuple[SuccessStage | FailedStage, ...]:
+        """Embed and upsert a stream of texts with embedding and upserts overlapped.
+
+        Three tasks joined by bounded queues: the source feeds texts, an embed
+        worker produces HybridEmbeddings (dense-only when encoder is None), and
+        an upsert worker flushes batch_size points or whatever arrived within
+        flush_interval_s. While Ollama embeds item i+1, Qdrant is upserting
+        earlier items, so wall time tends toward the slowest stage rather than
+        the sum. Bounded queues keep memory flat however long the stream is.
+
+        Per-item success stages are not kept (that would hold every embedding
+        until the stream ends); only failed embeddings and one stage per upsert
+        batch are returned, in completion order.
+
+        Args:
+            items: (text, payload) pairs, consumed as they arrive
+            dense_model: Dense embedding model identifier (e.g., "nomic-embed-text")
+            ollama: Async Ollama client (StorageService.get_embedding_client)
+            encoder: Loaded SPLADE model, or None for dense-only points
+            qdrant: Async Qdrant client instance
+            collection: Target collection name
+            stage_name: Name for every stage this stream produces
+            batch_size: Maximum points per upsert request
+            flush_interval_s: Longest a partial batch waits before upserting
+            queue_size: Items buffered between workers before backpressure
+
+        Returns:
+            Failed embedding stages and upsert batch stages
+        """
+        to_embed: asyncio.Queue[tuple[str, Payload] | None] = asyncio.Queue(queue_size)
+        to_upsert: asyncio.Queue[tuple[HybridEmbedding, Payload] | None] = asyncio.Queue(queue_size)
+        stages: list[SuccessStage | FailedStage] = []
+
+        async def produce() -> None:
+            async for item in items:
+                await to_embed.put(item)
+            await to_embed.put(None)
+
+        async def embed() -> None:
+            while (item := await to_embed.get()) is not None:
+                text, payload = item
+                if encoder is None:
+                    stage = await self._create_dense_embedding_stage(text, dense_model, ollama, stage_name)
+                else:
+                    stage = await self._create_hybrid_embedding_stage(text, dense_model, ollama, encoder, stage_name)
+
+                if isinstance(stage, SuccessStage):
+                    embedding: HybridEmbedding = stage.data  # type: ignore[assignment]
+                    await to_upsert.put((embedding, payload))
+                else:
+                    stages.append(stage)
+            await to_upsert.put(None)
+
+        async def upsert() -> None:
+            loop = asyncio.get_running_loop()
+            closed = False
+            while not closed:
+                batch: list[tuple[HybridEmbedding, Payload]] = []
+                try:
+                    async with asyncio.timeout_at(loop.time() + flush_interval_s):
+                        while len(batch) < batch_size:
+                            if (item := await to_upsert.get()) is None:
+                                closed = True
+                                break
+                            batch.append(item)
+                except TimeoutError:
+                    pass  # Flush whatever arrived in this window
+
+                if batch:
+                    stages.append(await self._create_upsert_batch_stage(batch, qdrant, collection, stage_name))
+
+        t0 = perf_counter_ns()
+        try:
+            async with asyncio.TaskGroup() as workers:
+                workers.create_task(produce())
+                workers.create_task(embed())
+                workers.create_task(upsert())
+        except* Exception as group:
+            # Stages never raise, so this is the source iterable failing mid-stream
+            start, end = _stage_window(t0)
+            stages.append(
+                FailedStage(
+                    status=StageStatus.FAILED,
+                    category=StageCategory.INGESTION,
+                    error_category=ErrorCategory.DEPENDENCY,
+                    name=stage_name,
+                    error=ErrorMessage(str(group.exceptions[0])),
+                    start_time=start,
+                    end_time=end,
+                )
             )
 
+        return tuple(stages)
+
 
 __all__ = [
     "DenseEmbeddingModel",
     "HybridEmbedding",
+    "HybridEmbeddingBatch",
+    "QuantizationMode",
     "SparseEmbeddingModel",
     "VectorIngestion",
     "VectorType",
@@ -1,14 +1,19 @@
-"""Storage service - thin orchestrator for Redis, MinIO, and Qdrant clients."""
+"""Storage service - thin orchestrator for Redis, MinIO, Qdrant and embedding clients."""
 
 from __future__ import annotations
 
+import asyncio
+import os
 from typing import TYPE_CHECKING
+from weakref import WeakKeyDictionary
 
 from pydantic import BaseModel, ConfigDict
 
 if TYPE_CHECKING:
+    from fastembed import SparseTextEmbedding
     from minio import Minio
-    from qdrant_client import QdrantClient
+    from ollama import AsyncClient as OllamaClient
+    from qdrant_client import AsyncQdrantClient
     from redis.asyncio import Redis
 
 
@@ -32,10 +37,27 @@ class ObjectStoreConfig(BaseModel):
 
 
 class VectorStoreConfig(BaseModel):
-    """Qdrant vector database configuration."""
+    """Qdrant vector database configuration.
+
+    gRPC is preferred: protobuf frames carry float vectors as packed binary
+    instead of JSON number strings, roughly halving payload size and CPU for
+    embedding-heavy traffic. The REST url is still used for admin calls.
+    """
 
     url: str
     collection: str
+    prefer_grpc: bool = True
+    grpc_port: int = 6334
+    timeout: int = 30
+
+    model_config = ConfigDict(frozen=True)
+
+
+class EmbeddingConfig(BaseModel):
+    """Embedding backend configuration (Ollama for dense, FastEmbed for sparse)."""
+
+    ollama_url: str
+    ollama_timeout: int
 
     model_config = ConfigDict(frozen=True)
 
@@ -48,6 +70,7 @@ class StorageService:
     - Provide Redis client for conversation history
     - Provide MinIO client for file storage
     - Provide Qdrant client for vector search
+    - Provide embedding backends (Ollama client, SPLADE models) for vector ingestion
     - Lazy initialization for faster startup
     """
 
@@ -56,13 +79,17 @@ class StorageService:
         memory_config: MemoryStoreConfig,
         object_config: ObjectStoreConfig,
         vector_config: VectorStoreConfig,
+        embedding_config: EmbeddingConfig,
     ):
         self.memory_config = memory_config
         self.object_config = object_config
         self.vector_config = vector_config
+        self.embedding_config = embedding_config
         self._memory_client: Redis | None = None
         self._object_client: Minio | None = None
-        self._vector_client: QdrantClient | None = None
+        self._vector_clients: WeakKeyDictionary[asyncio.AbstractEventLoop, AsyncQdrantClient] = WeakKeyDictionary()
+        self._embedding_clients: WeakKeyDictionary[asyncio.AbstractEventLoop, OllamaClient] = WeakKeyDictionary()
+        self._sparse_models: dict[str, SparseTextEmbedding] = {}
 
     def get_memory_client(self) -> Redis:
         """Get or create Redis client (lazy)."""
@@ -85,22 +112,72 @@ class StorageService:
             )
         return self._object_client
 
-    def get_vector_client(self) -> QdrantClient:
-        """Get or create Qdrant client (lazy)."""
-        if self._vector_client is None:
-            from qdrant_client import QdrantClient
+    def get_vector_client(self) -> AsyncQdrantClient:
+        """Get or create async Qdrant client (lazy, one per event loop).
+
+        The grpc.aio channel behind the client is bound to the loop that
+        opened it, so each running loop gets its own client; entries drop when
+        their loop is collected. Must be called from a coroutine running on
+        the loop that will use it.
+        """
+        loop = asyncio.get_running_loop()
+        client = self._vector_clients.get(loop)
+        if client is None:
+            from qdrant_client import AsyncQdrantClient
+
+            client = AsyncQdrantClient(
+                url=self.vector_config.url,
+                prefer_grpc=self.vector_config.prefer_grpc,
+                grpc_port=self.vector_config.grpc_port,
+                timeout=self.vector_config.timeout,
+            )
+            self._vector_clients[loop] = client
+        return client
+
+    def get_embedding_client(self) -> OllamaClient:
+        """Get or create async Ollama client for dense embeddings (lazy, one per event loop).
+
+        Reusing a client keeps its HTTP connection pool warm across embedding
+        calls. The pool is bound to the loop that opened it, so each running
+        loop gets its own client; entries drop when their loop is collected.
+        Must be called from a coroutine running on the loop that will use it.
+        """
+        loop = asyncio.get_running_loop()
+        client = self._embedding_clients.get(loop)
+        if client is None:
+            from ollama import AsyncClient
+
+            client = AsyncClient(
+                host=self.embedding_config.ollama_url,
+                timeout=self.embedding_config.ollama_timeout,
+            )
+            self._embedding_clients[loop] = client
+        return client
+
+    def get_sparse_model(self, model_name: str) -> SparseTextEmbedding:
+        """Get or load FastEmbed sparse model by name (lazy, one per name)."""
+        if model_name not in self._sparse_models:
+            from fastembed import SparseTextEmbedding
 
-            self._vector_client = QdrantClient(url=self.vector_config.url)
-        return self._vector_client
+            self._sparse_models[model_name] = SparseTextEmbedding(model_name=model_name, threads=os.cpu_count())
+        return self._sparse_models[model_name]
 
 
 def create_storage_service(
     memory_config: MemoryStoreConfig,
     object_config: ObjectStoreConfig,
     vector_config: VectorStoreConfig,
+    embedding_config: EmbeddingConfig,
 ) -> StorageService:
     """Factory from infrastructure configs."""
-    return StorageService(memory_config, object_config, vector_config)
+    return StorageService(memory_config, object_config, vector_config, embedding_config)
 
 
-__all__ = ["MemoryStoreConfig", "ObjectStoreConfig", "StorageService", "VectorStoreConfig", "create_storage_service"]
+__all__ = [
+    "EmbeddingConfig",
+    "MemoryStoreConfig",
+    "ObjectStoreConfig",
+    "StorageService",
+    "VectorStoreConfig",
+    "create_storage_service",
+]
@@ -6,48 +6,106 @@ Environment strategy:
 - Integration tests: Use .env (real Docker stack with actual credentials)
 """
 
+from __future__ import annotations
+
+import os
 from datetime import UTC, datetime
 from pathlib import Path
+from typing import TYPE_CHECKING
 from uuid import uuid4
 
 import pytest
 from dotenv import load_dotenv
 
-# Determine which env file to use based on test markers/paths
-# Unit tests use .env.test (no infrastructure needed)
-# Integration tests use .env (real Docker stack)
-import os
-import sys
+# App modules read settings at import time, so they are imported inside the
+# fixtures below - after pytest_configure has loaded the env file.
+if TYPE_CHECKING:
+    from app.domain.conversation import ConversationHistory
+    from app.domain.domain_value import ConversationId, MessageId, StoredMessage
 
-if "integration" in " ".join(sys.argv):
-    ENV_FILE = Path(__file__).parent.parent / ".env"
-else:
-    # Default to .env.test for unit tests
-    ENV_FILE = Path(__file__).parent.parent / ".env.test"
+PROJECT_ROOT = Path(__file__).parent.parent
+FASTEMBED_CACHE_DIR = PROJECT_ROOT / ".cache" / "fastembed"
 
-load_dotenv(ENV_FILE, override=True)
 
-from pydantic_ai.messages import ModelRequest, TextPart
+# Collections created by hand while exploring hybrid search; not owned by any test
+MANUAL_TEST_COLLECTIONS = ("test_hybrid_search",)
 
-from app.domain.conversation import ConversationHistory
-from app.domain.domain_value import ConversationId, MessageId, StoredMessage
 
+def _is_integration_run(config: pytest.Config) -> bool:
+    """Integration runs are selected by marker (``-m integration``) or path (``tests/integration``).
 
-@pytest.fixture
+    pytest.ini's default ``-m "not integration"`` names the marker too, so a
+    negated expression does not count as selecting it.
+    """
+    markexpr = config.getoption("markexpr") or ""
+    by_marker = "integration" in markexpr and "not integration" not in markexpr
+    return by_marker or any("integration" in arg for arg in config.args)
+
+
+def pytest_configure(config: pytest.Config) -> None:
+    """
+    Load the env file once per session, before any test module imports settings.
+
+    Integration runs use the real stack's ``.env``. Every other run uses the
+    isolated ``.env.test``.
+    """
+    env_file = PROJECT_ROOT / (".env" if _is_integration_run(config) else ".env.test")
+    load_dotenv(env_file, override=True)
+
+    # FastEmbed defaults to the system temp dir; a project-local cache keeps the
+    # SPLADE download across runs (and can be cached as a CI artifact)
+    os.environ.setdefault("FASTEMBED_CACHE_PATH", str(FASTEMBED_CACHE_DIR))
+
+
+def pytest_sessionfinish(session: pytest.Session) -> None:
+    """
+    Drop leftover manual-test collections once per integration run.
+
+    Under pytest-xdist every worker finishes its own session too; only the
+    controller (no ``workerinput``) cleans up, after all workers are done.
+    """
+    config = session.config
+    if not _is_integration_run(config) or config.option.collectonly or hasattr(config, "workerinput"):
+        return
+
+    from qdrant_client import QdrantClient
+
+    qdrant = QdrantClient(url="http://localhost:6333")
+    for collection_name in MANUAL_TEST_COLLECTIONS:
+        try:
+            qdrant.delete_collection(collection_name)
+        except Exception:
+            pass  # Collection may not exist, or the stack is already down
+
+
+# Frozen domain values below are built once per session and shared across
+# tests. Fixtures holding a pydantic-ai ModelRequest stay function-scoped:
+# its parts list is mutable, so one test could leak changes into the next.
+
+
+@pytest.fixture(scope="session")
 def message_id() -> MessageId:
     """Generate a valid MessageId for testing."""
+    from app.domain.domain_value import MessageId
+
     return MessageId(uuid4())
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def conversation_id() -> ConversationId:
     """Generate a valid ConversationId for testing."""
+    from app.domain.domain_value import ConversationId
+
     return ConversationId(uuid4())
 
 
 @pytest.fixture
 def stored_message(message_id: MessageId) -> StoredMessage:
     """Create a valid StoredMessage for testing."""
+    from pydantic_ai.messages import ModelRequest, TextPart
+
+    from app.domain.domain_value import StoredMessage
+
     return StoredMessage(
         id=message_id,
         content=ModelRequest(parts=[TextPart(content="Test message")]),
@@ -55,13 +113,17 @@ def stored_message(message_id: MessageId) -> StoredMessage:
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def empty_history(conversation_id: ConversationId) -> ConversationHistory:
     """Create an empty ConversationHistory for testing."""
+    from app.domain.conversation import ConversationHistory
+
     return ConversationHistory(id=conversation_id, messages=())
 
 
 @pytest.fixture
 def history_with_messages(conversation_id: ConversationId, stored_message: StoredMessage) -> ConversationHistory:
     """Create a ConversationHistory with one message for testing."""
+    from app.domain.conversation import ConversationHistory
+
     return ConversationHistory(id=conversation_id, messages=()).append_message(stored_message)
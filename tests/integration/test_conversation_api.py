@@ -17,27 +17,38 @@ import uuid
 import httpx
 import pytest
 
+# Network-bound: safe to overlap with other files under `pytest -m integration -n auto --dist=loadfile`
+pytestmark = [pytest.mark.integration, pytest.mark.integration_parallel]
 
-@pytest.fixture
-def api_base_url():
-    """Base URL for the running API."""
-    return "http://localhost:8000"
 
+@pytest.fixture(scope="session")
+def api_client():
+    """One keep-alive client for the running API, shared by every test.
 
-def test_create_new_conversation_without_id(api_base_url: str):
+    Module-level httpx.post/get open a new connection per call; a shared
+    client reuses pooled connections instead.
+    """
+    with httpx.Client(
+        base_url="http://localhost:8000",
+        timeout=httpx.Timeout(30.0),
+        limits=httpx.Limits(max_keepalive_connections=20, max_connections=20),
+    ) as client:
+        yield client
+
+
+def test_create_new_conversation_without_id(api_client: httpx.Client):
     """
     Demonstrates: Creating a new conversation (happy path).
     
     When no conversation_id is provided, the system generates one.
     This tests our core business flow end-to-end.
     """
-    response = httpx.post(
-        f"{api_base_url}/conversation/",
+    response = api_client.post(
+        "/conversation/",
         json={
             "text": "Hello, world!",
             "auto_route": False,
         },
-        timeout=30.0,
     )
     
     assert response.status_code == 200
@@ -52,108 +63,91 @@ def test_create_new_conversation_without_id(api_base_url: str):
     assert "content" in data["message"]
 
 
-def test_create_conversation_with_provided_id(api_base_url: str):
+@pytest.fixture(scope="class")
+def warm_conversation(api_client: httpx.Client) -> dict:
     """
-    Demonstrates: Idempotent conversation creation.
-    
-    When a conversation_id is provided but doesn't exist yet,
-    the system creates a new conversation with that ID.
-    This is the bug we just fixed.
+    Create one conversation with a caller-provided ID, shared by a test class.
+
+    Each POST costs a real LLM generation; read-only checks against the same
+    conversation reuse this one instead of creating their own.
     """
-    # Generate a fresh UUID
     conv_id = str(uuid.uuid4())
-    
-    response = httpx.post(
-        f"{api_base_url}/conversation/",
+    response = api_client.post(
+        "/conversation/",
         json={
             "text": "First message",
             "conversation_id": conv_id,
             "auto_route": False,
         },
-        timeout=30.0,
     )
-    
-    assert response.status_code == 200
-    data = response.json()
-    
-    # System used our provided ID
-    assert data["conversation_id"] == conv_id
-    assert "message" in data
+    return {"id": conv_id, "status_code": response.status_code, "first_response": response.json()}
 
 
-def test_continue_existing_conversation(api_base_url: str):
-    """
-    Demonstrates: Multi-turn conversation state management.
-    
-    After creating a conversation, we can continue it by providing
-    the same conversation_id. This tests state persistence.
-    """
-    conv_id = str(uuid.uuid4())
-    
-    # First message
-    response1 = httpx.post(
-        f"{api_base_url}/conversation/",
-        json={
-            "text": "First message",
-            "conversation_id": conv_id,
-            "auto_route": False,
-        },
-        timeout=30.0,
-    )
-    assert response1.status_code == 200
-    
-    # Second message to same conversation
-    response2 = httpx.post(
-        f"{api_base_url}/conversation/",
-        json={
-            "text": "Second message",
-            "conversation_id": conv_id,
-            "auto_route": False,
-        },
-        timeout=30.0,
-    )
-    assert response2.status_code == 200
-    data = response2.json()
-    
-    # Same conversation ID
-    assert data["conversation_id"] == conv_id
-    
-    # Token count increased (proves history was loaded)
-    assert data["total_tokens"] > 0
+class TestConversationLifecycle:
+    """Create-then-inspect checks sharing one warm conversation."""
 
+    def test_create_conversation_with_provided_id(self, warm_conversation: dict):
+        """
+        Demonstrates: Idempotent conversation creation.
 
-def test_get_conversation_metadata(api_base_url: str):
-    """
-    Demonstrates: Reading conversation state.
-    
-    After creating a conversation, we can retrieve its metadata.
-    This tests the GET endpoint.
-    """
-    conv_id = str(uuid.uuid4())
-    
-    # Create conversation
-    httpx.post(
-        f"{api_base_url}/conversation/",
-        json={
-            "text": "Test message",
-            "conversation_id": conv_id,
-            "auto_route": False,
-        },
-        timeout=30.0,
-    )
-    
-    # Get metadata
-    response = httpx.get(f"{api_base_url}/conversation/{conv_id}", timeout=10.0)
-    
-    assert response.status_code == 200
-    data = response.json()
-    
-    assert data["conversation_id"] == conv_id
-    assert data["message_count"] >= 2  # User message + AI response
-    assert data["total_tokens"] > 0
+        When a conversation_id is provided but doesn't exist yet,
+        the system creates a new conversation with that ID.
+        This is the bug we just fixed.
+        """
+        assert warm_conversation["status_code"] == 200
+        data = warm_conversation["first_response"]
+
+        # System used our provided ID
+        assert data["conversation_id"] == warm_conversation["id"]
+        assert "message" in data
+
+    def test_get_conversation_metadata(self, api_client: httpx.Client, warm_conversation: dict):
+        """
+        Demonstrates: Reading conversation state.
+
+        After creating a conversation, we can retrieve its metadata.
+        This tests the GET endpoint.
+        """
+        conv_id = warm_conversation["id"]
+
+        response = api_client.get(f"/conversation/{conv_id}", timeout=10.0)
+
+        assert response.status_code == 200
+        data = response.json()
+
+        assert data["conversation_id"] == conv_id
+        assert data["message_count"] >= 2  # User message + AI response
+        assert data["total_tokens"] > 0
+
+    def test_continue_existing_conversation(self, api_client: httpx.Client, warm_conversation: dict):
+        """
+        Demonstrates: Multi-turn conversation state management.
+
+        After creating a conversation, we can continue it by providing
+        the same conversation_id. This tests state persistence.
+        """
+        conv_id = warm_conversation["id"]
+
+        # Second message to same conversation
+        response = api_client.post(
+            "/conversation/",
+            json={
+                "text": "Second message",
+                "conversation_id": conv_id,
+                "auto_route": False,
+            },
+        )
+        assert response.status_code == 200
+        data = response.json()
+
+        # Same conversation ID
+        assert data["conversation_id"] == conv_id
+
+        # Token count increased (proves history was loaded)
+        assert data["total_tokens"] > warm_conversation["first_response"]["total_tokens"]
 
 
-def test_get_nonexistent_conversation_returns_404(api_base_url: str):
+def test_get_nonexistent_conversation_returns_404(api_client: httpx.Client):
     """
     Demonstrates: Error handling for missing resources.
     
@@ -162,21 +156,21 @@ def test_get_nonexistent_conversation_returns_404(api_base_url: str):
     """
     fake_id = str(uuid.uuid4())
     
-    response = httpx.get(f"{api_base_url}/conversation/{fake_id}", timeout=10.0)
+    response = api_client.get(f"/conversation/{fake_id}", timeout=10.0)
     
     assert response.status_code == 404
     assert "not found" in response.json()["detail"].lower()
 
 
-def test_invalid_model_id_returns_400(api_base_url: str):
+def test_invalid_model_id_returns_400(api_client: httpx.Client):
     """
     Demonstrates: Input validation at API boundary.
     
     When an invalid model_id is provided, the API returns 400.
     This tests our error handling, not Pydantic validation.
     """
-    response = httpx.post(
-        f"{api_base_url}/conversation/",
+    response = api_client.post(
+        "/conversation/",
         json={
             "text": "Hello",
             "model_id": "fake-nonexistent-model",
@@ -189,13 +183,13 @@ def test_invalid_model_id_returns_400(api_base_url: str):
     assert "Invalid model" in response.json()["detail"]
 
 
-def test_list_available_models(api_base_url: str):
+def test_list_available_models(api_client: httpx.Client):
     """
     Demonstrates: Utility endpoint for model discovery.
     
     Users can query available models before sending messages.
     """
-    response = httpx.get(f"{api_base_url}/conversation/models", timeout=10.0)
+    response = api_client.get("/conversation/models", timeout=10.0)
     
     assert response.status_code == 200
     models = response.json()
@@ -7,26 +7,41 @@ Demonstrates:
 - Minimal integration test that proves the stack works
 """
 
+from collections.abc import AsyncIterator
+
+import httpx
 import pytest
-from fastapi.testclient import TestClient
+import pytest_asyncio
+
+from app.main import app
 
+pytestmark = pytest.mark.integration
 
-@pytest.fixture
-def client():
-    """Create FastAPI test client."""
-    from app.main import app
 
-    return TestClient(app)
+@pytest_asyncio.fixture(scope="session", loop_scope="session")
+async def client() -> AsyncIterator[httpx.AsyncClient]:
+    """Create an in-process ASGI client, wired once and shared by every test.
+
+    ASGITransport calls the app directly on the test's event loop - no
+    TestClient thread bridge and no socket. It doesn't send lifespan events,
+    so startup/shutdown run here, exactly once per session.
+    """
+    async with (
+        app.router.lifespan_context(app),
+        httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://test") as client,
+    ):
+        yield client
 
 
-def test_health_endpoint_returns_200(client: TestClient):
+@pytest.mark.asyncio(loop_scope="session")
+async def test_health_endpoint_returns_200(client: httpx.AsyncClient):
     """
     Demonstrates: Integration test for critical path.
 
     This proves the FastAPI app is configured correctly and can handle requests.
     We don't test framework behavior—we test our integration is correct.
     """
-    response = client.get("/health")
+    response = await client.get("/health")
 
     assert response.status_code == 200
     data = response.json()
@@ -34,13 +49,14 @@ def test_health_endpoint_returns_200(client: TestClient):
     assert data["service"] == "ai-native-app"
 
 
-def test_health_endpoint_uses_correct_content_type(client: TestClient):
+@pytest.mark.asyncio(loop_scope="session")
+async def test_health_endpoint_uses_correct_content_type(client: httpx.AsyncClient):
     """
     Demonstrates: Testing HTTP concerns at API boundary.
 
     This is an API layer responsibility—ensure correct content-type header.
     We don't test FastAPI itself, we test our endpoint configuration.
     """
-    response = client.get("/health")
+    response = await client.get("/health")
 
     assert "application/json" in response.headers["content-type"]
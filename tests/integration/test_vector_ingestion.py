@@ -11,84 +11,139 @@ Demonstrates:
 Test Environment:
 - Uses .env.test (via conftest.py) which has localhost URLs pre-configured
 - Requires real Docker infrastructure running (make dev)
-- Qdrant at localhost:6333, Ollama at localhost:11434
+- Qdrant at localhost:6333 (gRPC on 6334), Ollama at localhost:11434
 - FastEmbed SPLADE model auto-downloads on first run
 
 Note: conftest.py loads .env.test for tests not in "integration" path,
       but .env.test has the correct localhost URLs we need anyway.
 """
 
+import asyncio
+from collections.abc import AsyncIterator, Iterator
 from uuid import uuid4
 
 import pytest
-from qdrant_client import QdrantClient
-from qdrant_client.models import Distance, Payload, SparseVector, VectorParams
+import pytest_asyncio
+from fastembed import SparseTextEmbedding
+from ollama import AsyncClient as OllamaClient
+from qdrant_client import AsyncQdrantClient, QdrantClient
+from qdrant_client.models import (
+    Distance,
+    FieldCondition,
+    Filter,
+    FilterSelector,
+    MatchValue,
+    Payload,
+    PayloadSchemaType,
+    QueryRequest,
+    SparseVector,
+    VectorParams,
+)
 
 from app.config import settings
-from app.domain.pipeline import StageName
+from app.domain.pipeline import StageName, SuccessStage
 from app.domain.vector_ingestion import (
     DenseEmbeddingModel,
     HybridEmbedding,
-    SparseEmbeddingModel,
+    HybridEmbeddingBatch,
     VectorIngestion,
     VectorType,
 )
 
+# Network-bound: safe to overlap with other files under `pytest -m integration -n auto --dist=loadfile`
+pytestmark = pytest.mark.integration_parallel
+
+# Stand-in dense vector for tests that don't call Ollama; built once, reused
+# for both the upserted embedding and the query (nomic-embed-text dimension)
+MOCK_DENSE_VECTOR: list[float] = [0.1] * 768
+
 
-@pytest.fixture(scope="module", autouse=True)
+@pytest.fixture(scope="session", autouse=True)
 def use_localhost_for_docker_services():
     """
     Override Docker service names with localhost for host-based integration testing.
 
     Why this is needed:
-    - conftest.py loads .env when 'integration' in sys.argv (this file's path)
+    - conftest.py loads .env when the run selects integration tests (this file's path)
     - .env has Docker service names (http://qdrant:6333) for container-to-container
     - These tests run from host machine, need localhost:6333 to reach Docker services
     - .env.test already has localhost URLs, but conftest doesn't load it for integration/
 
     This fixture applies .env.test values to settings after .env is loaded.
     Alternative: Move these tests to tests/unit/ but they test real infrastructure.
+
+    Leftover manual-test collections are dropped once per run by conftest.py's
+    pytest_sessionfinish, not here, so parallel workers don't race on cleanup.
     """
     settings.qdrant_url = "http://localhost:6333"
     settings.ollama_base_url = "http://localhost:11434"
 
-    yield
 
-    # Module teardown: Clean up any leftover test collections
-    qdrant = QdrantClient(url=settings.qdrant_url)
-    for collection_name in ["test_hybrid_search"]:  # Hardcoded names from manual testing
-        try:
-            qdrant.delete_collection(collection_name)
-        except Exception:
-            pass  # Collection may not exist
+@pytest.fixture(scope="session")
+def qdrant_client() -> Iterator[QdrantClient]:
+    """Qdrant client for real Docker infrastructure via localhost.
 
+    One gRPC channel for the whole session: every test's collection setup,
+    assertions and queries multiplex over it instead of reconnecting.
+    """
+    client = QdrantClient(url=settings.qdrant_url, prefer_grpc=True)
+    yield client
+    client.close()
 
-@pytest.fixture
-def qdrant_client() -> QdrantClient:
-    """Create Qdrant client for real Docker infrastructure via localhost."""
-    return QdrantClient(url=settings.qdrant_url)
 
+@pytest_asyncio.fixture(scope="session", loop_scope="session")
+async def async_qdrant_client() -> AsyncIterator[AsyncQdrantClient]:
+    """Async Qdrant client (gRPC, as in StorageService) for the stages under test.
 
-@pytest.fixture
-def test_collection_name() -> str:
-    """Generate unique collection name for test isolation."""
-    return f"test_vector_ingestion_{uuid4().hex[:8]}"
+    grpc.aio channels are bound to the event loop that opened them, so the
+    shared client and every async test in this module run on the session loop.
+    """
+    client = AsyncQdrantClient(url=settings.qdrant_url, prefer_grpc=True)
+    yield client
+    await client.close()
 
 
 @pytest.fixture
-def test_collection(qdrant_client: QdrantClient, test_collection_name: str):
-    """Create test collection with hybrid vectors, cleanup after test.
+def ollama_client() -> OllamaClient:
+    """Create async Ollama client for dense embedding stages."""
+    return OllamaClient(host=settings.ollama_base_url, timeout=settings.ollama_timeout)
+
+
+@pytest.fixture(scope="session")
+def dense_model() -> DenseEmbeddingModel:
+    """Configured Ollama embedding model, validated once per session."""
+    return DenseEmbeddingModel(settings.ollama_embedding_model)
+
+
+@pytest.fixture(scope="session")
+def sparse_encoder() -> SparseTextEmbedding:
+    """Load SPLADE once per session - model load dominates sparse embedding cost.
+
+    One throwaway inference warms the ONNX session so the first test
+    doesn't absorb graph initialization in its timings.
+    """
+    encoder = SparseTextEmbedding(model_name="prithivida/Splade_PP_en_v1")
+    list(encoder.embed(["warmup"]))
+    return encoder
+
+
+def run_filter(test_run_id: str) -> Filter:
+    """Match only the points one test wrote to the shared collection."""
+    return Filter(must=[FieldCondition(key="test_run_id", match=MatchValue(value=test_run_id))])
+
+
+def create_hybrid_collection(qdrant_client: QdrantClient) -> str:
+    """Create a uniquely named collection with hybrid vectors, returning its name.
 
     Demonstrates:
     - Qdrant named vectors (dense + sparse)
     - HNSW configuration for semantic search
-    - Test isolation with unique collection names
+    - Keyword payload index for cheap per-test filtering and cleanup
     """
-    # Create collection with correct embedding dimensions
+    collection_name = f"test_vector_ingestion_{uuid4().hex[:8]}"
     # Note: nomic-embed-text is 768, but other models may differ
-    # For tests, we'll create collection on-demand with actual vector from first embedding
     qdrant_client.create_collection(
-        collection_name=test_collection_name,
+        collection_name=collection_name,
         vectors_config={
             VectorType.DENSE.value: VectorParams(
                 size=768,  # nomic-embed-text dimension (from settings.ollama_embedding_model)
@@ -99,14 +154,52 @@ def test_collection(qdrant_client: QdrantClient, test_collection_name: str):
             VectorType.SPARSE.value: {},  # SPLADE uses default config
         },
     )
+    qdrant_client.create_payload_index(collection_name, "test_run_id", PayloadSchemaType.KEYWORD)
+    return collection_name
 
-    yield test_collection_name
 
-    # Cleanup
+def drop_collection(qdrant_client: QdrantClient, collection_name: str) -> None:
+    """Delete a test collection, tolerating one that was never created."""
     try:
-        qdrant_client.delete_collection(test_collection_name)
+        qdrant_client.delete_collection(collection_name)
     except Exception:
-        pass  # Collection may not exist if test failed early
+        pass  # Collection may not exist if setup failed early
+
+
+@pytest.fixture(scope="module")
+def shared_collection(qdrant_client: QdrantClient) -> Iterator[str]:
+    """One hybrid collection for the module - created once, dropped once.
+
+    Creating and dropping a collection per test costs two round-trips and
+    kicks off optimizer work on every empty collection.
+    """
+    collection_name = create_hybrid_collection(qdrant_client)
+    yield collection_name
+    drop_collection(qdrant_client, collection_name)
+
+
+@pytest.fixture
+def test_run_id() -> str:
+    """Tag for this test's points; include it in every payload the test writes."""
+    return uuid4().hex
+
+
+@pytest.fixture
+def test_collection(qdrant_client: QdrantClient, shared_collection: str, test_run_id: str) -> Iterator[str]:
+    """Shared collection for one test; deletes only that test's points afterwards."""
+    yield shared_collection
+    qdrant_client.delete(
+        collection_name=shared_collection,
+        points_selector=FilterSelector(filter=run_filter(test_run_id)),
+    )
+
+
+@pytest.fixture
+def isolated_collection(qdrant_client: QdrantClient) -> Iterator[str]:
+    """Private collection per test, for tests that need whole-collection state."""
+    collection_name = create_hybrid_collection(qdrant_client)
+    yield collection_name
+    drop_collection(qdrant_client, collection_name)
 
 
 @pytest.fixture
@@ -116,8 +209,10 @@ def ingestion() -> VectorIngestion:
 
 
 @pytest.mark.integration
-@pytest.mark.asyncio
-async def test_dense_embedding_generation(ingestion: VectorIngestion):
+@pytest.mark.asyncio(loop_scope="session")
+async def test_dense_embedding_generation(
+    ingestion: VectorIngestion, ollama_client: OllamaClient, dense_model: DenseEmbeddingModel
+):
     """
     Demonstrates: Dense embedding via Ollama.
 
@@ -125,12 +220,12 @@ async def test_dense_embedding_generation(ingestion: VectorIngestion):
     Dense vectors capture meaning and context for semantic similarity.
     """
     text = "Machine learning is a subset of artificial intelligence"
-    model = DenseEmbeddingModel(settings.ollama_embedding_model)
     stage_name = StageName("test_dense_embed")
 
     stage = await ingestion._create_dense_embedding_stage(
         text=text,
-        model=model,
+        model=dense_model,
+        ollama=ollama_client,
         stage_name=stage_name,
     )
 
@@ -148,8 +243,36 @@ async def test_dense_embedding_generation(ingestion: VectorIngestion):
 
 
 @pytest.mark.integration
-@pytest.mark.asyncio
-async def test_sparse_embedding_generation(ingestion: VectorIngestion):
+@pytest.mark.asyncio(loop_scope="session")
+async def test_dense_embedding_batch_generation(
+    ingestion: VectorIngestion, ollama_client: OllamaClient, dense_model: DenseEmbeddingModel
+):
+    """
+    Demonstrates: Batched dense embedding via one Ollama request.
+
+    Tests that many texts embed in a single call and come back in input order.
+    """
+    texts = ["Qdrant stores vectors", "Ollama runs models locally", "Redis caches results"]
+    stage_name = StageName("test_dense_embed_batch")
+
+    stage = await ingestion._create_dense_embedding_batch_stage(
+        texts=texts,
+        model=dense_model,
+        ollama=ollama_client,
+        stage_name=stage_name,
+    )
+
+    assert stage.status.value == "success"
+    batch = stage.data
+    assert isinstance(batch, HybridEmbeddingBatch)
+    assert [embedding.text for embedding in batch.root] == texts
+    assert all(len(embedding.dense) > 0 for embedding in batch.root)
+    assert all(embedding.sparse is None for embedding in batch.root)
+
+
+@pytest.mark.integration
+@pytest.mark.asyncio(loop_scope="session")
+async def test_sparse_embedding_generation(ingestion: VectorIngestion, sparse_encoder: SparseTextEmbedding):
     """
     Demonstrates: Sparse embedding via FastEmbed SPLADE.
 
@@ -157,12 +280,11 @@ async def test_sparse_embedding_generation(ingestion: VectorIngestion):
     Sparse vectors complement dense embeddings in hybrid search.
     """
     text = "PostgreSQL database performance optimization"
-    model = SparseEmbeddingModel("prithivida/Splade_PP_en_v1")
     stage_name = StageName("test_sparse_embed")
 
     stage = await ingestion._create_sparse_embedding_stage(
         text=text,
-        model=model,
+        encoder=sparse_encoder,
         stage_name=stage_name,
     )
 
@@ -181,11 +303,77 @@ async def test_sparse_embedding_generation(ingestion: VectorIngestion):
 
 
 @pytest.mark.integration
-@pytest.mark.asyncio
+@pytest.mark.asyncio(loop_scope="session")
+async def test_sparse_embedding_batch_generation(ingestion: VectorIngestion, sparse_encoder: SparseTextEmbedding):
+    """
+    Demonstrates: Batched sparse embedding through one cached SPLADE session.
+
+    Tests that many texts embed in one pass and come back in input order.
+    """
+    texts = ["PostgreSQL indexes", "Neo4j graph traversal", "MinIO object storage"]
+    stage_name = StageName("test_sparse_embed_batch")
+
+    stage = await ingestion._create_sparse_embedding_batch_stage(
+        texts=texts,
+        encoder=sparse_encoder,
+        stage_name=stage_name,
+    )
+
+    assert stage.status.value == "success"
+    batch = stage.data
+    assert isinstance(batch, HybridEmbeddingBatch)
+    assert [embedding.text for embedding in batch.root] == texts
+    assert all(isinstance(embedding.sparse, SparseVector) for embedding in batch.root)
+    assert all(len(embedding.sparse.indices) > 0 for embedding in batch.root)
+
+
+@pytest.mark.integration
+@pytest.mark.asyncio(loop_scope="session")
+async def test_hybrid_embedding_generation(
+    ingestion: VectorIngestion,
+    ollama_client: OllamaClient,
+    dense_model: DenseEmbeddingModel,
+    sparse_encoder: SparseTextEmbedding,
+):
+    """
+    Demonstrates: Fused dense + sparse embedding in a single stage.
+
+    Tests that both vectors are produced together, with no merge step.
+    """
+    text = "Hybrid search combines semantic and keyword matching"
+    stage_name = StageName("test_hybrid_embed")
+
+    stage = await ingestion._create_hybrid_embedding_stage(
+        text=text,
+        dense_model=dense_model,
+        ollama=ollama_client,
+        encoder=sparse_encoder,
+        stage_name=stage_name,
+    )
+
+    assert stage.status.value == "success"
+    embedding = stage.data
+    assert isinstance(embedding, HybridEmbedding)
+    assert embedding.text == text
+    assert len(embedding.dense) > 0
+    assert isinstance(embedding.sparse, SparseVector)
+    assert embedding.is_hybrid
+
+    # Stages skip validation via model_construct; the output must still validate
+    validated = HybridEmbedding.model_validate(embedding.model_dump())
+    assert validated.text == text
+    assert validated.sparse == embedding.sparse
+    SuccessStage.model_validate(dict(stage))
+
+
+@pytest.mark.integration
+@pytest.mark.asyncio(loop_scope="session")
 async def test_upsert_to_qdrant(
     ingestion: VectorIngestion,
     qdrant_client: QdrantClient,
+    async_qdrant_client: AsyncQdrantClient,
     test_collection: str,
+    test_run_id: str,
 ):
     """
     Demonstrates: Upserting hybrid embedding to Qdrant.
@@ -197,16 +385,16 @@ async def test_upsert_to_qdrant(
     text = "The quick brown fox jumps over the lazy dog"
     embedding = HybridEmbedding(
         text=text,
-        dense=[0.1] * 768,  # Mock dense vector
+        dense=MOCK_DENSE_VECTOR,
         sparse=SparseVector(indices=[100, 200, 300], values=[0.5, 0.3, 0.2]),
     )
-    payload: Payload = {"source": "test", "category": "example", "text": text}
+    payload: Payload = {"source": "test", "category": "example", "text": text, "test_run_id": test_run_id}
     stage_name = StageName("test_upsert")
 
     stage = await ingestion._create_upsert_stage(
         embedding=embedding,
         payload=payload,
-        qdrant=qdrant_client,
+        qdrant=async_qdrant_client,
         collection=test_collection,
         stage_name=stage_name,
     )
@@ -216,60 +404,189 @@ async def test_upsert_to_qdrant(
     assert stage.name == stage_name
 
     # Verify in Qdrant
-    collection_info = qdrant_client.get_collection(test_collection)
-    assert collection_info.points_count == 1
+    assert qdrant_client.count(test_collection, count_filter=run_filter(test_run_id), exact=True).count == 1
 
-    # Query to verify data (use named vector query for hybrid collections)
-    results = qdrant_client.query_points(
+    # Query both named vectors in one round-trip; each must find the point
+    batch_results = qdrant_client.query_batch_points(
         collection_name=test_collection,
-        query=[0.1] * 768,  # Dense vector
-        using=VectorType.DENSE.value,  # Specify which named vector to use
-        limit=1,
-        with_payload=True,
+        requests=[
+            QueryRequest(
+                query=MOCK_DENSE_VECTOR,
+                using=VectorType.DENSE.value,
+                filter=run_filter(test_run_id),
+                limit=1,
+                with_payload=True,
+            ),
+            QueryRequest(
+                query=embedding.sparse,
+                using=VectorType.SPARSE.value,
+                filter=run_filter(test_run_id),
+                limit=1,
+                with_payload=True,
+            ),
+        ],
+    )
+    for results in batch_results:
+        assert len(results.points) == 1
+        point = results.points[0]
+        assert point.payload["source"] == "test"
+        assert point.payload["text"] == text
+
+
+@pytest.mark.integration
+@pytest.mark.asyncio(loop_scope="session")
+async def test_batch_upsert_to_qdrant(
+    ingestion: VectorIngestion,
+    qdrant_client: QdrantClient,
+    async_qdrant_client: AsyncQdrantClient,
+    test_collection: str,
+    test_run_id: str,
+):
+    """
+    Demonstrates: Upserting many points in a single Qdrant request.
+
+    Tests that every (embedding, payload) pair in the batch is stored.
+    """
+    points: list[tuple[HybridEmbedding, Payload]] = [
+        (
+            HybridEmbedding(
+                text=f"document {i}",
+                dense=[0.1 * (i + 1)] * 768,
+                sparse=SparseVector(indices=[i], values=[1.0]),
+            ),
+            {"source": "test", "index": i, "test_run_id": test_run_id},
+        )
+        for i in range(5)
+    ]
+
+    stage = await ingestion._create_upsert_batch_stage(
+        points=points,
+        qdrant=async_qdrant_client,
+        collection=test_collection,
+        stage_name=StageName("test_upsert_batch"),
+    )
+
+    assert stage.status.value == "success"
+    assert qdrant_client.count(test_collection, count_filter=run_filter(test_run_id), exact=True).count == len(points)
+
+
+@pytest.mark.integration
+@pytest.mark.asyncio(loop_scope="session")
+async def test_upsert_is_idempotent(
+    ingestion: VectorIngestion,
+    qdrant_client: QdrantClient,
+    async_qdrant_client: AsyncQdrantClient,
+    test_collection: str,
+    test_run_id: str,
+):
+    """
+    Demonstrates: Content-derived point ids make retries safe.
+
+    Upserting the same text and payload twice leaves a single point.
+    """
+    embedding = HybridEmbedding(text="retry me", dense=MOCK_DENSE_VECTOR)
+    payload: Payload = {"source": "test", "test_run_id": test_run_id}
+
+    for attempt in range(2):
+        stage = await ingestion._create_upsert_stage(
+            embedding=embedding,
+            payload=payload,
+            qdrant=async_qdrant_client,
+            collection=test_collection,
+            stage_name=StageName(f"upsert_attempt_{attempt}"),
+        )
+        assert stage.status.value == "success"
+
+    assert qdrant_client.count(test_collection, count_filter=run_filter(test_run_id), exact=True).count == 1
+
+
+@pytest.mark.integration
+@pytest.mark.asyncio(loop_scope="session")
+async def test_streaming_ingest_to_qdrant(
+    ingestion: VectorIngestion,
+    qdrant_client: QdrantClient,
+    async_qdrant_client: AsyncQdrantClient,
+    ollama_client: OllamaClient,
+    dense_model: DenseEmbeddingModel,
+    sparse_encoder: SparseTextEmbedding,
+    test_collection: str,
+    test_run_id: str,
+):
+    """
+    Demonstrates: Streaming ingestion with overlapped embedding and upserts.
+
+    Tests that every streamed text lands in Qdrant and that upserts are
+    grouped into batch stages rather than one stage per text. The flush
+    interval outlasts the stream, so batches close on size alone: 5 texts
+    in batches of 2 make exactly 3 upsert stages.
+    """
+
+    async def texts():
+        for i in range(5):
+            yield f"streamed document {i}", {"source": "test", "index": i, "test_run_id": test_run_id}
+
+    stages = await ingestion._create_streaming_ingest_stages(
+        items=texts(),
+        dense_model=dense_model,
+        ollama=ollama_client,
+        encoder=sparse_encoder,
+        qdrant=async_qdrant_client,
+        collection=test_collection,
+        stage_name=StageName("test_stream"),
+        batch_size=2,
+        flush_interval_s=60.0,
     )
-    assert len(results.points) == 1
-    point = results.points[0]
-    assert point.payload["source"] == "test"
-    assert point.payload["text"] == text
+
+    assert all(isinstance(stage, SuccessStage) for stage in stages)
+    assert [stage.name for stage in stages] == [StageName("test_stream")] * 3
+
+    points, _ = qdrant_client.scroll(test_collection, scroll_filter=run_filter(test_run_id), limit=10)
+    assert sorted(point.payload["index"] for point in points if point.payload) == [0, 1, 2, 3, 4]
 
 
 @pytest.mark.integration
-@pytest.mark.asyncio
+@pytest.mark.asyncio(loop_scope="session")
 async def test_end_to_end_hybrid_ingestion(
     ingestion: VectorIngestion,
+    ollama_client: OllamaClient,
+    dense_model: DenseEmbeddingModel,
+    sparse_encoder: SparseTextEmbedding,
     qdrant_client: QdrantClient,
+    async_qdrant_client: AsyncQdrantClient,
     test_collection: str,
+    test_run_id: str,
 ):
     """
     Demonstrates: Complete hybrid RAG ingestion pipeline.
 
     End-to-end test showing:
     1. Dense embedding generation (Ollama)
-    2. Sparse embedding generation (FastEmbed SPLADE)
+    2. Sparse embedding generation (FastEmbed SPLADE), concurrent with step 1
     3. Combining into HybridEmbedding
     4. Upserting to Qdrant with metadata
-    5. Querying back to verify
+    5. Querying both named vectors back in one batch to verify
 
     This is the full production flow for ingesting documents into vector store.
     """
     text = "Rust programming language provides memory safety without garbage collection"
 
-    # Step 1: Generate dense embedding
-    dense_stage = await ingestion._create_dense_embedding_stage(
-        text=text,
-        model=DenseEmbeddingModel(settings.ollama_embedding_model),
-        stage_name=StageName("dense_embed"),
+    # Steps 1-2: Dense (Ollama I/O) and sparse (SPLADE on a worker thread) overlap
+    dense_stage, sparse_stage = await asyncio.gather(
+        ingestion._create_dense_embedding_stage(
+            text=text,
+            model=dense_model,
+            ollama=ollama_client,
+            stage_name=StageName("dense_embed"),
+        ),
+        ingestion._create_sparse_embedding_stage(
+            text=text,
+            encoder=sparse_encoder,
+            stage_name=StageName("sparse_embed"),
+        ),
     )
     assert dense_stage.status.value == "success"
-    dense_embedding = dense_stage.data
-
-    # Step 2: Generate sparse embedding
-    sparse_stage = await ingestion._create_sparse_embedding_stage(
-        text=text,
-        model=SparseEmbeddingModel("prithivida/Splade_PP_en_v1"),
-        stage_name=StageName("sparse_embed"),
-    )
     assert sparse_stage.status.value == "success"
+    dense_embedding = dense_stage.data
     sparse_result = sparse_stage.data
 
     # Step 3: Combine into hybrid embedding
@@ -284,35 +601,48 @@ async def test_end_to_end_hybrid_ingestion(
     assert hybrid_embedding.is_hybrid
 
     # Step 4: Upsert to Qdrant
-    payload: Payload = {"source": "integration_test", "language": "rust", "text": text}
+    payload: Payload = {"source": "integration_test", "language": "rust", "text": text, "test_run_id": test_run_id}
     upsert_stage = await ingestion._create_upsert_stage(
         embedding=hybrid_embedding,
         payload=payload,
-        qdrant=qdrant_client,
+        qdrant=async_qdrant_client,
         collection=test_collection,
         stage_name=StageName("upsert"),
     )
     assert upsert_stage.status.value == "success"
 
-    # Step 5: Verify via query
-    results = qdrant_client.query_points(
+    # Step 5: Verify via dense and sparse queries, batched into one round-trip
+    dense_results, sparse_results = qdrant_client.query_batch_points(
         collection_name=test_collection,
-        query=dense_embedding.dense,
-        using=VectorType.DENSE.value,  # Specify which named vector to query
-        limit=1,
-        with_payload=True,
+        requests=[
+            QueryRequest(
+                query=dense_embedding.dense.tolist(),
+                using=VectorType.DENSE.value,
+                filter=run_filter(test_run_id),
+                limit=1,
+                with_payload=True,
+            ),
+            QueryRequest(
+                query=hybrid_embedding.sparse,
+                using=VectorType.SPARSE.value,
+                filter=run_filter(test_run_id),
+                limit=1,
+                with_payload=True,
+            ),
+        ],
     )
-    assert len(results.points) == 1
-    point = results.points[0]
-    assert point.payload["source"] == "integration_test"
-    assert point.payload["language"] == "rust"
-    assert point.payload["text"] == text
-    assert point.score > 0.99  # Should match itself with high score
+    for results in (dense_results, sparse_results):
+        assert len(results.points) == 1
+        point = results.points[0]
+        assert point.payload["source"] == "integration_test"
+        assert point.payload["language"] == "rust"
+        assert point.payload["text"] == text
+    assert dense_results.points[0].score > 0.99  # Should match itself with high score
 
 
 @pytest.mark.integration
-@pytest.mark.asyncio
-async def test_dense_embedding_failure_handling(ingestion: VectorIngestion):
+@pytest.mark.asyncio(loop_scope="session")
+async def test_dense_embedding_failure_handling(ingestion: VectorIngestion, ollama_client: OllamaClient):
     """
     Demonstrates: Pipeline error handling for external service failures.
 
@@ -325,6 +655,7 @@ async def test_dense_embedding_failure_handling(ingestion: VectorIngestion):
     stage = await ingestion._create_dense_embedding_stage(
         text=text,
         model=model,
+        ollama=ollama_client,
         stage_name=stage_name,
     )
 
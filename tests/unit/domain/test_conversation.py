@@ -4,7 +4,7 @@ Tests for ConversationHistory domain model.
 These tests demonstrate:
 - Testing immutability patterns (not testing frozen=True itself)
 - Testing business logic (not testing Pydantic validation)
-- Testing transformations (append, empty factory)
+- Testing transformations (append, extend, empty factory)
 """
 
 from datetime import UTC, datetime
@@ -103,3 +103,51 @@ def test_append_multiple_messages_maintains_order():
     # Verify order is maintained (same order as appended)
     for i in range(5):
         assert history.messages[i] == messages[i]
+
+
+def test_append_message_reuses_existing_messages():
+    """
+    Demonstrates: Guarding a hot path's cost model without timing it.
+
+    append_message must share the existing StoredMessage objects, not copy,
+    re-validate or serialize them - any of those would make each append
+    scale with message size instead of a shallow tuple copy. Identity checks
+    catch that regression deterministically, unlike a wall-clock benchmark.
+    """
+    history = ConversationHistory(id=ConversationId(uuid4()), messages=())
+    for i in range(3):
+        history = history.append_message(
+            StoredMessage(id=MessageId(uuid4()), content=ModelRequest(parts=[TextPart(content=f"Message {i}")]))
+        )
+
+    new_msg = StoredMessage(id=MessageId(uuid4()), content=ModelRequest(parts=[TextPart(content="Next")]))
+    appended = history.append_message(new_msg)
+
+    assert all(new is old for new, old in zip(appended.messages, history.messages, strict=False))
+    assert appended.messages[-1] is new_msg
+
+
+def test_extend_messages_matches_repeated_append():
+    """
+    Demonstrates: Testing a bulk transformation against its definition.
+
+    extend_messages must produce exactly what chained append_message calls
+    would, while leaving the original history unchanged.
+    """
+    history = ConversationHistory(id=ConversationId(uuid4()), messages=())
+    messages = [
+        StoredMessage(
+            id=MessageId(uuid4()),
+            content=ModelRequest(parts=[TextPart(content=f"Message {i}")]),
+        )
+        for i in range(5)
+    ]
+
+    appended = history
+    for msg in messages:
+        appended = appended.append_message(msg)
+
+    extended = history.extend_messages(messages)
+
+    assert extended.messages == appended.messages == tuple(messages)
+    assert history.messages == ()
@@ -16,26 +16,26 @@ from app.domain.domain_type import AIModelVendor
 from app.domain.model_catalog import ModelCatalog, ModelRegistry, ModelSpec
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def model_catalog() -> ModelCatalog:
-    """Load the real model catalog from configuration."""
+    """Load the real model catalog from configuration, once per session (frozen, safe to share)."""
     catalog_path = Path(__file__).parents[3] / "src" / "app" / "domain" / "model_metadata.json"
     return ModelCatalog.from_json_file(catalog_path)
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def anthropic_sonnet_spec() -> ModelSpec:
-    """Create a ModelSpec for Anthropic Claude Sonnet."""
-    return ModelSpec(
+    """Create a ModelSpec for Anthropic Claude Sonnet (literal values, validation skipped)."""
+    return ModelSpec.model_construct(
         vendor=AIModelVendor.ANTHROPIC,
         variant_id="claude-sonnet-4-5-20250929",
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def anthropic_haiku_spec() -> ModelSpec:
-    """Create a ModelSpec for Anthropic Claude Haiku."""
-    return ModelSpec(
+    """Create a ModelSpec for Anthropic Claude Haiku (literal values, validation skipped)."""
+    return ModelSpec.model_construct(
         vendor=AIModelVendor.ANTHROPIC,
         variant_id="claude-3-5-haiku-20241022",
     )
@@ -27,6 +27,10 @@ from app.domain.pipeline import (
     SuccessStage,
 )
 
+# One fixed timestamp for every stage: durations are built as explicit
+# offsets from it, and no test reads the clock
+NOW = datetime(2024, 1, 1, tzinfo=UTC)
+
 
 # Test fixtures - simple domain models for stage data
 class ParsedData(BaseModel):
@@ -51,14 +55,14 @@ class TestSuccessStage:
 
     def test_duration_computed_from_timestamps(self):
         """Verify duration_ms computed property calculates correctly."""
-        start = datetime.now(UTC)
+        start = NOW
         end = start + timedelta(milliseconds=250.5)
 
-        stage = SuccessStage(
+        stage = SuccessStage.model_construct(
             status=StageStatus.SUCCESS,
             category=StageCategory.PARSING,
             name=StageName("parse"),
-            data=ParsedData(tokens=["hello", "world"]),
+            data=ParsedData.model_construct(tokens=["hello", "world"]),
             start_time=start,
             end_time=end,
         )
@@ -67,14 +71,14 @@ class TestSuccessStage:
 
     def test_duration_handles_subsecond_precision(self):
         """Verify duration handles microsecond precision."""
-        start = datetime.now(UTC)
+        start = NOW
         end = start + timedelta(milliseconds=42.123456)
 
-        stage = SuccessStage(
+        stage = SuccessStage.model_construct(
             status=StageStatus.SUCCESS,
             category=StageCategory.TRANSFORMATION,
             name=StageName("transform"),
-            data=ParsedData(tokens=["test"]),
+            data=ParsedData.model_construct(tokens=["test"]),
             start_time=start,
             end_time=end,
         )
@@ -83,13 +87,13 @@ class TestSuccessStage:
 
     def test_frozen_prevents_mutation(self):
         """Verify frozen=True prevents field mutation."""
-        stage = SuccessStage(
+        stage = SuccessStage.model_construct(
             status=StageStatus.SUCCESS,
             category=StageCategory.PARSING,
             name=StageName("parse"),
-            data=ParsedData(tokens=["test"]),
-            start_time=datetime.now(UTC),
-            end_time=datetime.now(UTC),
+            data=ParsedData.model_construct(tokens=["test"]),
+            start_time=NOW,
+            end_time=NOW,
         )
 
         with pytest.raises(ValidationError):
@@ -106,7 +110,7 @@ class TestFailedStage:
 
     def test_duration_computed_before_failure(self):
         """Verify duration_ms tracks time until failure occurred."""
-        start = datetime.now(UTC)
+        start = NOW
         end = start + timedelta(milliseconds=150)
 
         stage = FailedStage(
@@ -129,8 +133,8 @@ class TestFailedStage:
             error_category=ErrorCategory.VALIDATION,
             name=StageName("validate"),
             error=ErrorMessage("Invalid schema"),
-            start_time=datetime.now(UTC),
-            end_time=datetime.now(UTC),
+            start_time=NOW,
+            end_time=NOW,
         )
 
         external_error = FailedStage(
@@ -139,8 +143,8 @@ class TestFailedStage:
             error_category=ErrorCategory.EXTERNAL_SERVICE,
             name=StageName("save"),
             error=ErrorMessage("Database connection failed"),
-            start_time=datetime.now(UTC),
-            end_time=datetime.now(UTC),
+            start_time=NOW,
+            end_time=NOW,
         )
 
         assert validation_error.error_category != external_error.error_category
@@ -266,106 +270,138 @@ class TestErrorSummary:
 # =============================================================================
 
 
+# Canonical stages shared by the Pipeline tests. Stages are frozen and the
+# tests only read them, so each is validated once per module rather than
+# rebuilt in every test that needs "a success" or "a failure". Their data is
+# built with model_construct: hard-coded known-good values, nothing to validate.
+@pytest.fixture(scope="module")
+def parse_stage() -> SuccessStage:
+    """Successful parsing stage with zero duration."""
+    return SuccessStage(
+        status=StageStatus.SUCCESS,
+        category=StageCategory.PARSING,
+        name=StageName("parse"),
+        data=ParsedData.model_construct(tokens=[]),
+        start_time=NOW,
+        end_time=NOW,
+    )
+
+
+@pytest.fixture(scope="module")
+def enrich_stage() -> SuccessStage:
+    """Successful enrichment stage with zero duration."""
+    return SuccessStage(
+        status=StageStatus.SUCCESS,
+        category=StageCategory.ENRICHMENT,
+        name=StageName("enrich"),
+        data=EnrichedData.model_construct(keywords=[]),
+        start_time=NOW,
+        end_time=NOW,
+    )
+
+
+@pytest.fixture(scope="module")
+def save_stage() -> SuccessStage:
+    """Successful persistence stage with zero duration."""
+    return SuccessStage(
+        status=StageStatus.SUCCESS,
+        category=StageCategory.PERSISTENCE,
+        name=StageName("save"),
+        data=ParsedData.model_construct(tokens=[]),
+        start_time=NOW,
+        end_time=NOW,
+    )
+
+
+@pytest.fixture(scope="module")
+def failed_enrich_stage() -> FailedStage:
+    """Enrichment stage that failed with a transformation error."""
+    return FailedStage(
+        status=StageStatus.FAILED,
+        category=StageCategory.ENRICHMENT,
+        error_category=ErrorCategory.TRANSFORMATION,
+        name=StageName("enrich"),
+        error=ErrorMessage("Transformation failed"),
+        start_time=NOW,
+        end_time=NOW,
+    )
+
+
+@pytest.fixture(scope="module")
+def failed_validate_stage() -> FailedStage:
+    """Validation stage that failed with a validation error."""
+    return FailedStage(
+        status=StageStatus.FAILED,
+        category=StageCategory.VALIDATION,
+        error_category=ErrorCategory.VALIDATION,
+        name=StageName("validate"),
+        error=ErrorMessage("Invalid input"),
+        start_time=NOW,
+        end_time=NOW,
+    )
+
+
+@pytest.fixture(scope="module")
+def failed_save_stage() -> FailedStage:
+    """Persistence stage that failed on an external service."""
+    return FailedStage(
+        status=StageStatus.FAILED,
+        category=StageCategory.PERSISTENCE,
+        error_category=ErrorCategory.EXTERNAL_SERVICE,
+        name=StageName("save"),
+        error=ErrorMessage("Failed"),
+        start_time=NOW,
+        end_time=NOW,
+    )
+
+
+@pytest.fixture(scope="module")
+def skipped_notify_stage() -> SkippedStage:
+    """Notification stage skipped because it is disabled."""
+    return SkippedStage(
+        status=StageStatus.SKIPPED,
+        category=StageCategory.NOTIFICATION,
+        name=StageName("notify"),
+        skip_reason=SkipReason.DISABLED,
+        timestamp=NOW,
+    )
+
+
 class TestPipeline:
     """Test pipeline orchestration and aggregation logic."""
 
-    def test_append_returns_new_instance(self):
+    def test_append_returns_new_instance(self, parse_stage: SuccessStage):
         """Verify append immutably adds stage to pipeline."""
         pipeline = Pipeline()
-        stage = SuccessStage(
-            status=StageStatus.SUCCESS,
-            category=StageCategory.PARSING,
-            name=StageName("parse"),
-            data=ParsedData(tokens=["hello"]),
-            start_time=datetime.now(UTC),
-            end_time=datetime.now(UTC),
-        )
 
-        new_pipeline = pipeline.append(stage)
+        new_pipeline = pipeline.append(parse_stage)
 
         assert new_pipeline is not pipeline
         assert len(new_pipeline.stages) == 1
         assert len(pipeline.stages) == 0
-        assert new_pipeline.stages[0] == stage
+        assert new_pipeline.stages[0] == parse_stage
 
-    def test_multiple_appends_chain_immutably(self):
+    def test_multiple_appends_chain_immutably(self, parse_stage: SuccessStage, enrich_stage: SuccessStage):
         """Verify multiple appends create distinct instances."""
         pipeline = Pipeline()
-        stage1 = SuccessStage(
-            status=StageStatus.SUCCESS,
-            category=StageCategory.PARSING,
-            name=StageName("parse"),
-            data=ParsedData(tokens=["hello"]),
-            start_time=datetime.now(UTC),
-            end_time=datetime.now(UTC),
-        )
-        stage2 = SuccessStage(
-            status=StageStatus.SUCCESS,
-            category=StageCategory.ENRICHMENT,
-            name=StageName("enrich"),
-            data=EnrichedData(keywords=["greeting"]),
-            start_time=datetime.now(UTC),
-            end_time=datetime.now(UTC),
-        )
 
-        pipeline1 = pipeline.append(stage1)
-        pipeline2 = pipeline1.append(stage2)
+        pipeline1 = pipeline.append(parse_stage)
+        pipeline2 = pipeline1.append(enrich_stage)
 
         assert len(pipeline.stages) == 0
         assert len(pipeline1.stages) == 1
         assert len(pipeline2.stages) == 2
 
-    def test_succeeded_true_when_all_stages_success(self):
+    def test_succeeded_true_when_all_stages_success(self, parse_stage: SuccessStage, enrich_stage: SuccessStage):
         """Verify succeeded returns True when no failures."""
-        pipeline = Pipeline()
-        pipeline = pipeline.append(
-            SuccessStage(
-                status=StageStatus.SUCCESS,
-                category=StageCategory.PARSING,
-                name=StageName("parse"),
-                data=ParsedData(tokens=[]),
-                start_time=datetime.now(UTC),
-                end_time=datetime.now(UTC),
-            )
-        )
-        pipeline = pipeline.append(
-            SuccessStage(
-                status=StageStatus.SUCCESS,
-                category=StageCategory.ENRICHMENT,
-                name=StageName("enrich"),
-                data=EnrichedData(keywords=[]),
-                start_time=datetime.now(UTC),
-                end_time=datetime.now(UTC),
-            )
-        )
+        pipeline = Pipeline().append(parse_stage).append(enrich_stage)
 
         assert pipeline.succeeded is True
         assert pipeline.failed is False
 
-    def test_succeeded_false_when_any_stage_fails(self):
+    def test_succeeded_false_when_any_stage_fails(self, parse_stage: SuccessStage, failed_enrich_stage: FailedStage):
         """Verify succeeded returns False when any stage fails."""
-        pipeline = Pipeline()
-        pipeline = pipeline.append(
-            SuccessStage(
-                status=StageStatus.SUCCESS,
-                category=StageCategory.PARSING,
-                name=StageName("parse"),
-                data=ParsedData(tokens=[]),
-                start_time=datetime.now(UTC),
-                end_time=datetime.now(UTC),
-            )
-        )
-        pipeline = pipeline.append(
-            FailedStage(
-                status=StageStatus.FAILED,
-                category=StageCategory.ENRICHMENT,
-                error_category=ErrorCategory.TRANSFORMATION,
-                name=StageName("enrich"),
-                error=ErrorMessage("Transformation failed"),
-                start_time=datetime.now(UTC),
-                end_time=datetime.now(UTC),
-            )
-        )
+        pipeline = Pipeline().append(parse_stage).append(failed_enrich_stage)
 
         assert pipeline.succeeded is False
         assert pipeline.failed is True
@@ -376,20 +412,9 @@ class TestPipeline:
 
         assert pipeline.succeeded is False
 
-    def test_failed_true_when_any_stage_failed(self):
+    def test_failed_true_when_any_stage_failed(self, failed_validate_stage: FailedStage):
         """Verify failed detects any FailedStage."""
-        pipeline = Pipeline()
-        pipeline = pipeline.append(
-            FailedStage(
-                status=StageStatus.FAILED,
-                category=StageCategory.VALIDATION,
-                error_category=ErrorCategory.VALIDATION,
-                name=StageName("validate"),
-                error=ErrorMessage("Invalid input"),
-                start_time=datetime.now(UTC),
-                end_time=datetime.now(UTC),
-            )
-        )
+        pipeline = Pipeline().append(failed_validate_stage)
 
         assert pipeline.failed is True
 
@@ -403,8 +428,8 @@ class TestPipeline:
                 error_category=ErrorCategory.VALIDATION,
                 name=StageName("validate1"),
                 error=ErrorMessage("Error 1"),
-                start_time=datetime.now(UTC),
-                end_time=datetime.now(UTC),
+                start_time=NOW,
+                end_time=NOW,
             )
         )
         pipeline = pipeline.append(
@@ -414,8 +439,8 @@ class TestPipeline:
                 error_category=ErrorCategory.VALIDATION,
                 name=StageName("validate2"),
                 error=ErrorMessage("Error 2"),
-                start_time=datetime.now(UTC),
-                end_time=datetime.now(UTC),
+                start_time=NOW,
+                end_time=NOW,
             )
         )
         pipeline = pipeline.append(
@@ -425,8 +450,8 @@ class TestPipeline:
                 error_category=ErrorCategory.TIMEOUT,
                 name=StageName("api-call"),
                 error=ErrorMessage("Timeout"),
-                start_time=datetime.now(UTC),
-                end_time=datetime.now(UTC),
+                start_time=NOW,
+                end_time=NOW,
             )
         )
 
@@ -437,19 +462,9 @@ class TestPipeline:
         assert summary.total_errors == 3
         assert summary.most_common == ErrorCategory.VALIDATION
 
-    def test_error_summary_empty_when_no_failures(self):
+    def test_error_summary_empty_when_no_failures(self, parse_stage: SuccessStage):
         """Verify error_summary returns empty dict when all success."""
-        pipeline = Pipeline()
-        pipeline = pipeline.append(
-            SuccessStage(
-                status=StageStatus.SUCCESS,
-                category=StageCategory.PARSING,
-                name=StageName("parse"),
-                data=ParsedData(tokens=[]),
-                start_time=datetime.now(UTC),
-                end_time=datetime.now(UTC),
-            )
-        )
+        pipeline = Pipeline().append(parse_stage)
 
         summary = pipeline.error_summary
 
@@ -457,39 +472,11 @@ class TestPipeline:
         assert summary.total_errors == 0
         assert summary.most_common is None
 
-    def test_stage_categories_preserves_execution_order(self):
+    def test_stage_categories_preserves_execution_order(
+        self, parse_stage: SuccessStage, enrich_stage: SuccessStage, save_stage: SuccessStage
+    ):
         """Verify stage_categories tracks pipeline topology."""
-        pipeline = Pipeline()
-        pipeline = pipeline.append(
-            SuccessStage(
-                status=StageStatus.SUCCESS,
-                category=StageCategory.PARSING,
-                name=StageName("parse"),
-                data=ParsedData(tokens=[]),
-                start_time=datetime.now(UTC),
-                end_time=datetime.now(UTC),
-            )
-        )
-        pipeline = pipeline.append(
-            SuccessStage(
-                status=StageStatus.SUCCESS,
-                category=StageCategory.ENRICHMENT,
-                name=StageName("enrich"),
-                data=EnrichedData(keywords=[]),
-                start_time=datetime.now(UTC),
-                end_time=datetime.now(UTC),
-            )
-        )
-        pipeline = pipeline.append(
-            SuccessStage(
-                status=StageStatus.SUCCESS,
-                category=StageCategory.PERSISTENCE,
-                name=StageName("save"),
-                data=ParsedData(tokens=[]),
-                start_time=datetime.now(UTC),
-                end_time=datetime.now(UTC),
-            )
-        )
+        pipeline = Pipeline().append(parse_stage).append(enrich_stage).append(save_stage)
 
         assert pipeline.stage_categories == (
             StageCategory.PARSING,
@@ -499,13 +486,13 @@ class TestPipeline:
 
     def test_total_duration_sums_executed_stages(self):
         """Verify total_duration_ms aggregates success and failed stages."""
-        start = datetime.now(UTC)
+        start = NOW
 
         success = SuccessStage(
             status=StageStatus.SUCCESS,
             category=StageCategory.PARSING,
             name=StageName("parse"),
-            data=ParsedData(tokens=[]),
+            data=ParsedData.model_construct(tokens=[]),
             start_time=start,
             end_time=start + timedelta(milliseconds=100),
         )
@@ -527,13 +514,13 @@ class TestPipeline:
 
     def test_total_duration_excludes_skipped_stages(self):
         """Verify total_duration_ms ignores skipped stages."""
-        start = datetime.now(UTC)
+        start = NOW
 
         success = SuccessStage(
             status=StageStatus.SUCCESS,
             category=StageCategory.PARSING,
             name=StageName("parse"),
-            data=ParsedData(tokens=[]),
+            data=ParsedData.model_construct(tokens=[]),
             start_time=start,
             end_time=start + timedelta(milliseconds=100),
         )
@@ -548,32 +535,15 @@ class TestPipeline:
         pipeline = pipeline.append(success)
         pipeline = pipeline.append(skipped)
 
+        assert skipped.duration_ms == 0.0
+        assert "duration_ms" not in skipped.model_dump()
         assert pipeline.total_duration_ms == 100.0
 
-    def test_latest_stage_returns_most_recent(self):
+    def test_latest_stage_returns_most_recent(self, parse_stage: SuccessStage, enrich_stage: SuccessStage):
         """Verify latest_stage returns last appended stage."""
-        stage1 = SuccessStage(
-            status=StageStatus.SUCCESS,
-            category=StageCategory.PARSING,
-            name=StageName("parse"),
-            data=ParsedData(tokens=[]),
-            start_time=datetime.now(UTC),
-            end_time=datetime.now(UTC),
-        )
-        stage2 = SuccessStage(
-            status=StageStatus.SUCCESS,
-            category=StageCategory.ENRICHMENT,
-            name=StageName("enrich"),
-            data=EnrichedData(keywords=[]),
-            start_time=datetime.now(UTC),
-            end_time=datetime.now(UTC),
-        )
+        pipeline = Pipeline().append(parse_stage).append(enrich_stage)
 
-        pipeline = Pipeline()
-        pipeline = pipeline.append(stage1)
-        pipeline = pipeline.append(stage2)
-
-        assert pipeline.latest_stage == stage2
+        assert pipeline.latest_stage == enrich_stage
 
     def test_latest_stage_none_when_empty(self):
         """Verify latest_stage returns None for empty pipeline."""
@@ -581,102 +551,39 @@ class TestPipeline:
 
         assert pipeline.latest_stage is None
 
-    def test_latest_success_finds_most_recent_success(self):
+    def test_latest_success_finds_most_recent_success(
+        self, parse_stage: SuccessStage, enrich_stage: SuccessStage, failed_save_stage: FailedStage
+    ):
         """Verify latest_success returns most recent SuccessStage."""
-        success1 = SuccessStage(
-            status=StageStatus.SUCCESS,
-            category=StageCategory.PARSING,
-            name=StageName("parse"),
-            data=ParsedData(tokens=[]),
-            start_time=datetime.now(UTC),
-            end_time=datetime.now(UTC),
-        )
-        success2 = SuccessStage(
-            status=StageStatus.SUCCESS,
-            category=StageCategory.ENRICHMENT,
-            name=StageName("enrich"),
-            data=EnrichedData(keywords=[]),
-            start_time=datetime.now(UTC),
-            end_time=datetime.now(UTC),
-        )
-        failed = FailedStage(
-            status=StageStatus.FAILED,
-            category=StageCategory.PERSISTENCE,
-            error_category=ErrorCategory.EXTERNAL_SERVICE,
-            name=StageName("save"),
-            error=ErrorMessage("Failed"),
-            start_time=datetime.now(UTC),
-            end_time=datetime.now(UTC),
-        )
+        pipeline = Pipeline().append(parse_stage).append(enrich_stage).append(failed_save_stage)
 
-        pipeline = Pipeline()
-        pipeline = pipeline.append(success1)
-        pipeline = pipeline.append(success2)
-        pipeline = pipeline.append(failed)
-
-        assert pipeline.latest_success == success2
+        assert pipeline.latest_success == enrich_stage
         assert pipeline.latest_success.name.root == "enrich"
 
-    def test_latest_success_skips_failures_and_skips(self):
+    def test_latest_success_skips_failures_and_skips(
+        self, parse_stage: SuccessStage, failed_enrich_stage: FailedStage, skipped_notify_stage: SkippedStage
+    ):
         """Verify latest_success ignores non-success stages."""
-        success = SuccessStage(
-            status=StageStatus.SUCCESS,
-            category=StageCategory.PARSING,
-            name=StageName("parse"),
-            data=ParsedData(tokens=[]),
-            start_time=datetime.now(UTC),
-            end_time=datetime.now(UTC),
-        )
-        failed = FailedStage(
-            status=StageStatus.FAILED,
-            category=StageCategory.ENRICHMENT,
-            error_category=ErrorCategory.TRANSFORMATION,
-            name=StageName("enrich"),
-            error=ErrorMessage("Failed"),
-            start_time=datetime.now(UTC),
-            end_time=datetime.now(UTC),
-        )
-        skipped = SkippedStage(
-            status=StageStatus.SKIPPED,
-            category=StageCategory.NOTIFICATION,
-            name=StageName("notify"),
-            skip_reason=SkipReason.DISABLED,
-        )
+        pipeline = Pipeline().append(parse_stage).append(failed_enrich_stage).append(skipped_notify_stage)
 
-        pipeline = Pipeline()
-        pipeline = pipeline.append(success)
-        pipeline = pipeline.append(failed)
-        pipeline = pipeline.append(skipped)
+        assert pipeline.latest_success == parse_stage
 
-        assert pipeline.latest_success == success
-
-    def test_latest_success_none_when_no_success(self):
+    def test_latest_success_none_when_no_success(self, failed_validate_stage: FailedStage):
         """Verify latest_success returns None when no successful stages."""
-        pipeline = Pipeline()
-        pipeline = pipeline.append(
-            FailedStage(
-                status=StageStatus.FAILED,
-                category=StageCategory.VALIDATION,
-                error_category=ErrorCategory.VALIDATION,
-                name=StageName("validate"),
-                error=ErrorMessage("Failed"),
-                start_time=datetime.now(UTC),
-                end_time=datetime.now(UTC),
-            )
-        )
+        pipeline = Pipeline().append(failed_validate_stage)
 
         assert pipeline.latest_success is None
 
     def test_latest_data_extracts_from_latest_success(self):
         """Verify latest_data returns data from most recent success."""
-        data = ParsedData(tokens=["hello", "world"])
+        data = ParsedData.model_construct(tokens=["hello", "world"])
         success = SuccessStage(
             status=StageStatus.SUCCESS,
             category=StageCategory.PARSING,
             name=StageName("parse"),
             data=data,
-            start_time=datetime.now(UTC),
-            end_time=datetime.now(UTC),
+            start_time=NOW,
+            end_time=NOW,
         )
 
         pipeline = Pipeline()
@@ -684,38 +591,116 @@ class TestPipeline:
 
         assert pipeline.latest_data == data
 
-    def test_latest_data_raises_when_no_success(self):
+    def test_latest_data_raises_when_no_success(self, failed_validate_stage: FailedStage):
         """Verify latest_data raises ValueError when no successful stages."""
-        pipeline = Pipeline()
-        pipeline = pipeline.append(
-            FailedStage(
-                status=StageStatus.FAILED,
-                category=StageCategory.VALIDATION,
-                error_category=ErrorCategory.VALIDATION,
-                name=StageName("validate"),
-                error=ErrorMessage("Failed"),
-                start_time=datetime.now(UTC),
-                end_time=datetime.now(UTC),
-            )
-        )
+        pipeline = Pipeline().append(failed_validate_stage)
 
         with pytest.raises(ValueError, match="No successful stages in pipeline"):
             _ = pipeline.latest_data
 
-    def test_to_logfire_attributes_returns_wrapped_dict(self):
-        """Verify to_logfire_attributes returns LogfireAttributes model."""
-        pipeline = Pipeline()
-        pipeline = pipeline.append(
+    def test_aggregates_reflect_stage_appended_after_read(
+        self, parse_stage: SuccessStage, failed_enrich_stage: FailedStage
+    ):
+        """Verify reading aggregates doesn't leave a stale cache on appended pipelines."""
+        pipeline = Pipeline().append(parse_stage)
+        assert pipeline.succeeded is True
+
+        failed = pipeline.append(failed_enrich_stage)
+
+        assert pipeline.succeeded is True
+        assert failed.succeeded is False
+        assert failed.failed is True
+        assert failed.error_summary.root == {ErrorCategory.TRANSFORMATION: 1}
+        assert failed.stage_categories == (StageCategory.PARSING, StageCategory.ENRICHMENT)
+
+    def test_appended_pipeline_equals_constructed_pipeline(self, parse_stage: SuccessStage):
+        """Verify equality compares stages, not how the pipeline was built."""
+        assert Pipeline(stages=(parse_stage,)) == Pipeline().append(parse_stage)
+
+    def test_equality_unaffected_by_reading_aggregates(self, parse_stage: SuccessStage):
+        """Verify filling the summary cache doesn't change equality."""
+        read = Pipeline(stages=(parse_stage,))
+        unread = Pipeline(stages=(parse_stage,))
+
+        assert read.succeeded is True
+
+        assert read == unread
+        assert unread == read
+
+    def test_model_copy_recomputes_aggregates_for_new_stages(
+        self, parse_stage: SuccessStage, failed_enrich_stage: FailedStage
+    ):
+        """Verify model_copy(update=...) doesn't carry over stale aggregates."""
+        pipeline = Pipeline().append(parse_stage)
+        assert pipeline.stage_categories == (StageCategory.PARSING,)
+
+        cleared = pipeline.model_copy(update={"stages": ()})
+        replaced = pipeline.model_copy(update={"stages": (failed_enrich_stage,)})
+
+        assert cleared.stage_categories == ()
+        assert cleared.succeeded is False
+        assert cleared.total_duration_ms == 0.0
+        assert replaced.failed is True
+        assert replaced.latest_success is None
+        assert pipeline.model_copy(deep=True).succeeded is True
+
+    def test_appended_aggregates_match_constructed_pipeline(self):
+        """Verify aggregates extended on append equal a from-scratch reduction."""
+        start = NOW
+        stages = (
             SuccessStage(
                 status=StageStatus.SUCCESS,
                 category=StageCategory.PARSING,
                 name=StageName("parse"),
-                data=ParsedData(tokens=[]),
-                start_time=datetime.now(UTC),
-                end_time=datetime.now(UTC),
-            )
+                data=ParsedData.model_construct(tokens=[]),
+                start_time=start,
+                end_time=start + timedelta(milliseconds=100),
+            ),
+            FailedStage(
+                status=StageStatus.FAILED,
+                category=StageCategory.ENRICHMENT,
+                error_category=ErrorCategory.TIMEOUT,
+                name=StageName("enrich"),
+                error=ErrorMessage("Timeout"),
+                start_time=start,
+                end_time=start + timedelta(milliseconds=50),
+            ),
+            SkippedStage(
+                status=StageStatus.SKIPPED,
+                category=StageCategory.NOTIFICATION,
+                name=StageName("notify"),
+                skip_reason=SkipReason.DISABLED,
+            ),
         )
 
+        appended = Pipeline()
+        for stage in stages:
+            appended = appended.append(stage)
+        constructed = Pipeline(stages=stages)
+
+        assert appended == constructed
+        assert appended.to_logfire_attributes() == constructed.to_logfire_attributes()
+        assert appended.latest_success == constructed.latest_success == stages[0]
+        assert appended.error_summary == constructed.error_summary
+
+    def test_append_preserves_subclass_fields(self, parse_stage: SuccessStage):
+        """Verify append carries subclass fields over instead of resetting them."""
+
+        class TracedPipeline(Pipeline):
+            trace_id: str = "unset"
+
+        pipeline = TracedPipeline(trace_id="abc123").append(parse_stage)
+
+        assert isinstance(pipeline, TracedPipeline)
+        assert pipeline.trace_id == "abc123"
+        assert pipeline.stages == (parse_stage,)
+        assert pipeline == TracedPipeline(trace_id="abc123", stages=(parse_stage,))
+        assert pipeline != TracedPipeline(stages=(parse_stage,))
+
+    def test_to_logfire_attributes_returns_wrapped_dict(self, parse_stage: SuccessStage):
+        """Verify to_logfire_attributes returns LogfireAttributes model."""
+        pipeline = Pipeline().append(parse_stage)
+
         attrs = pipeline.to_logfire_attributes()
 
         assert isinstance(attrs, LogfireAttributes)
@@ -723,14 +708,14 @@ class TestPipeline:
 
     def test_to_logfire_attributes_structure(self):
         """Verify Logfire attributes contain expected keys."""
-        start = datetime.now(UTC)
+        start = NOW
         pipeline = Pipeline()
         pipeline = pipeline.append(
             SuccessStage(
                 status=StageStatus.SUCCESS,
                 category=StageCategory.PARSING,
                 name=StageName("parse"),
-                data=ParsedData(tokens=[]),
+                data=ParsedData.model_construct(tokens=[]),
                 start_time=start,
                 end_time=start + timedelta(milliseconds=100),
             )
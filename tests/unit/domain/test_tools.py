@@ -0,0 +1,109 @@
+"""
+Tests for the calculator tool.
+
+These tests demonstrate:
+- Testing tool behavior through its public async function
+- Testing security boundaries (whitelist enforcement before execution)
+- Testing error-as-result contract (tools return messages, never raise)
+"""
+
+import pytest
+
+from app.domain.tools import calculator
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    ("expression", "expected"),
+    [
+        ("5 + 3 * 2", "11"),
+        ("factorial(5)", "120"),
+        ("-2 ** 2", "-4"),
+        ("max(1, 7, 3) % 4", "3"),
+        ("sqrt(16) + pi - pi", "4.0"),
+        ("2 ** (3 * 4)", "4096"),
+        ("factorial(2 + 3)", "120"),
+        ("2 ** (1/2)", "1.4142135623730951"),
+        ("8 ** (1/3)", "2.0"),
+        ("e ** (-1/2)", "0.6065306597126334"),
+        ("2 ** sqrt(2)", "2.665144142690225"),
+        ("(1 + 0.04/12) ** 360", "3.3134980146069424"),
+    ],
+)
+async def test_calculator_evaluates_whitelisted_expressions(expression: str, expected: str):
+    """
+    Demonstrates: Testing business behavior (arithmetic results).
+
+    Whitelisted operators, functions, and constants evaluate to the
+    same results Python arithmetic would produce.
+    """
+    assert await calculator(None, expression) == expected  # type: ignore[arg-type]
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "expression",
+    [
+        "__import__('os')",
+        "(1).__class__",
+        "open",
+        "[x for x in (1, 2)]",
+        "round(2.5, ndigits=1)",
+        "(lambda: 1)()",
+    ],
+)
+async def test_calculator_rejects_non_whitelisted_expressions(expression: str):
+    """
+    Demonstrates: Testing the security boundary.
+
+    Anything outside the whitelist is rejected before execution and
+    reported back as an error message the LLM can act on.
+    """
+    result = await calculator(None, expression)  # type: ignore[arg-type]
+
+    assert result.startswith("Error evaluating expression")
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "expression",
+    [
+        "factorial(1000000)",
+        "2 ** 10 ** 10",
+        "10 ** 301",
+        "0.5 ** -5000",
+        "2 ** (999999 * 999999)",
+        "factorial(factorial(20))",
+        "2 ** round(1e12)",
+        "factorial(max(5, 10 ** 6))",
+        "abs(abs(9 ** 300) ** 300) ** 300",
+        "abs((-8) ** (1/3) * 10) ** 300",
+    ],
+)
+async def test_calculator_rejects_expressions_beyond_budget(expression: str):
+    """
+    Demonstrates: Testing a scalability guard.
+
+    Literal inputs that would hang a worker are rejected up front
+    instead of being evaluated.
+    """
+    result = await calculator(None, expression)  # type: ignore[arg-type]
+
+    assert result.startswith("Error evaluating expression")
+
+
+@pytest.mark.asyncio
+async def test_calculator_reports_time_limit(monkeypatch: pytest.MonkeyPatch):
+    """
+    Demonstrates: Testing the evaluation time budget.
+
+    Evaluation runs off the event loop; when it outlives the configured
+    budget the tool answers with a time-limit message instead of blocking.
+    """
+    from app.config import settings
+
+    monkeypatch.setattr(settings, "calculator_timeout_s", 1e-9)
+
+    result = await calculator(None, "factorial(1000)")  # type: ignore[arg-type]
+
+    assert result == "Error: expression exceeded time limit"
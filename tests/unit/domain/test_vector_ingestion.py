@@ -0,0 +1,215 @@
+"""
+Tests for vector ingestion domain types.
+
+These tests demonstrate:
+- Testing smart enum behavior (enum methods that build vendor config)
+- Composing Qdrant's own config types rather than wrapping them
+- Testing validated primitive types (crash on invalid construction)
+- Testing upsert stages against Qdrant's in-process local mode (no Docker)
+"""
+
+from collections.abc import AsyncIterator
+from datetime import UTC, datetime
+
+import pytest
+import pytest_asyncio
+from pydantic import ValidationError
+from qdrant_client import AsyncQdrantClient
+from qdrant_client.models import (
+    BinaryQuantization,
+    Distance,
+    Payload,
+    ScalarQuantization,
+    ScalarType,
+    SparseVector,
+    VectorParams,
+)
+
+from app.domain.domain_type import StageCategory, StageStatus
+from app.domain.pipeline import FailedStage, StageName, SuccessStage
+from app.domain.vector_ingestion import (
+    DenseEmbeddingModel,
+    HybridEmbedding,
+    QuantizationMode,
+    SparseEmbeddingModel,
+    VectorIngestion,
+    VectorType,
+)
+
+COLLECTION = "unit_hybrid"
+NOW = datetime(2024, 1, 1, tzinfo=UTC)
+
+
+@pytest_asyncio.fixture
+async def local_qdrant() -> AsyncIterator[AsyncQdrantClient]:
+    """In-process Qdrant (local mode) with a small hybrid collection.
+
+    Same client API as the server, so upsert stages run unchanged in
+    milliseconds; the live-server path stays in tests/integration.
+    """
+    client = AsyncQdrantClient(location=":memory:")
+    await client.create_collection(
+        collection_name=COLLECTION,
+        vectors_config={VectorType.DENSE.value: VectorParams(size=4, distance=Distance.COSINE)},
+        sparse_vectors_config={VectorType.SPARSE.value: {}},
+    )
+    yield client
+    await client.close()
+
+
+def make_embedding(text: str, seed: float) -> HybridEmbedding:
+    """Deterministic hybrid embedding standing in for Ollama + SPLADE output."""
+    return HybridEmbedding(
+        text=text,
+        dense=[seed, seed + 0.1, seed + 0.2, seed + 0.3],
+        sparse=SparseVector(indices=[int(seed * 10)], values=[1.0]),
+    )
+
+
+def test_int8_quantization_builds_scalar_config():
+    """
+    Demonstrates: Smart enum producing a vendor config object.
+
+    INT8 maps to Qdrant's scalar quantization with int8 storage.
+    """
+    config = QuantizationMode.INT8.quantization_config()
+
+    assert isinstance(config, ScalarQuantization)
+    assert config.scalar.type == ScalarType.INT8
+
+
+@pytest.mark.parametrize(
+    ("mode", "expected_type"),
+    [
+        (QuantizationMode.BINARY, BinaryQuantization),
+        (QuantizationMode.NONE, type(None)),
+    ],
+)
+def test_quantization_config_per_mode(mode: QuantizationMode, expected_type: type):
+    """
+    Demonstrates: Exhaustive mapping from enum value to config.
+
+    Every mode yields the matching Qdrant config (or none at all).
+    """
+    assert isinstance(mode.quantization_config(), expected_type)
+
+
+def test_embedding_model_is_plain_string():
+    """
+    Demonstrates: Validated type that needs no unwrapping.
+
+    Model identifiers pass straight to embedding clients as strings.
+    """
+    model = DenseEmbeddingModel("nomic-embed-text")
+
+    assert model == "nomic-embed-text"
+    assert isinstance(model, str)
+    assert not isinstance(model, SparseEmbeddingModel)
+
+
+@pytest.mark.parametrize("model_type", [DenseEmbeddingModel, SparseEmbeddingModel])
+@pytest.mark.parametrize("name", ["", "x" * 201])
+def test_embedding_model_rejects_invalid_names(model_type: type, name: str):
+    """
+    Demonstrates: Invalid data crashes at construction.
+
+    Empty or oversized identifiers never reach an embedding backend.
+    """
+    with pytest.raises(ValidationError):
+        model_type(name)
+
+
+def test_embeddings_compare_by_vector_values():
+    """
+    Demonstrates: Value equality on a model holding a NumPy array.
+
+    Equal embeddings compare equal (element-wise on the dense vector) instead
+    of raising, and so do stages whose data is an embedding.
+    """
+    first = make_embedding("hello", 0.1)
+    same = make_embedding("hello", 0.1)
+    other = make_embedding("hello", 0.5)
+
+    assert first == same
+    assert first != other
+    stage = SuccessStage.model_construct(
+        status=StageStatus.SUCCESS,
+        category=StageCategory.TRANSFORMATION,
+        name=StageName("embed"),
+        data=first,
+        start_time=NOW,
+        end_time=NOW,
+    )
+    assert stage == stage.model_copy(update={"data": same})
+
+
+def test_embedding_json_schema_describes_dense_as_number_list():
+    """
+    Demonstrates: Schema generation for an arbitrary (ndarray) field type.
+
+    The dense vector is documented as the list of floats it serializes to.
+    """
+    for mode in ("validation", "serialization"):
+        schema = HybridEmbedding.model_json_schema(mode=mode)
+
+        assert schema["properties"]["dense"] == {"type": "array", "items": {"type": "number"}}
+
+
+@pytest.mark.asyncio
+async def test_upsert_batch_stores_every_point(local_qdrant: AsyncQdrantClient):
+    """
+    Demonstrates: Testing a persistence stage without infrastructure.
+
+    Every (embedding, payload) pair lands as one point, with both named
+    vectors and its payload.
+    """
+    points: list[tuple[HybridEmbedding, Payload]] = [
+        (make_embedding(f"document {i}", seed=0.1 * (i + 1)), {"index": i}) for i in range(3)
+    ]
+
+    stage = await VectorIngestion()._create_upsert_batch_stage(
+        points=points, qdrant=local_qdrant, collection=COLLECTION, stage_name=StageName("upsert_batch")
+    )
+
+    assert isinstance(stage, SuccessStage)
+    records, _ = await local_qdrant.scroll(COLLECTION, with_payload=True, with_vectors=True)
+    assert sorted(record.payload["index"] for record in records) == [0, 1, 2]
+    assert all(set(record.vector) == {VectorType.DENSE.value, VectorType.SPARSE.value} for record in records)
+
+
+@pytest.mark.asyncio
+async def test_upsert_same_content_twice_keeps_one_point(local_qdrant: AsyncQdrantClient):
+    """
+    Demonstrates: Testing the idempotency contract of content-derived ids.
+
+    Retrying an upsert with the same text and payload overwrites the point.
+    """
+    ingestion = VectorIngestion()
+    embedding = make_embedding("retry me", seed=0.5)
+
+    for _ in range(2):
+        await ingestion._create_upsert_stage(
+            embedding=embedding,
+            payload={"source": "unit"},
+            qdrant=local_qdrant,
+            collection=COLLECTION,
+            stage_name=StageName("upsert"),
+        )
+
+    assert (await local_qdrant.count(COLLECTION, exact=True)).count == 1
+
+
+@pytest.mark.asyncio
+async def test_upsert_to_missing_collection_fails_as_stage(local_qdrant: AsyncQdrantClient):
+    """
+    Demonstrates: Testing the railway contract (errors become stages, never raise).
+    """
+    stage = await VectorIngestion()._create_upsert_stage(
+        embedding=make_embedding("orphan", seed=0.2),
+        payload={},
+        qdrant=local_qdrant,
+        collection="does_not_exist",
+        stage_name=StageName("upsert"),
+    )
+
+    assert isinstance(stage, FailedStage)